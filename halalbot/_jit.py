@@ -0,0 +1,27 @@
+"""
+Optional Numba support shared by the compiled kernels in this package.
+
+Kernels are decorated with :func:`njit` and written against plain arrays and
+scalars.  When Numba is installed they compile to native code; without it the
+fallback decorator leaves them as ordinary Python, and callers check
+``NUMBA_AVAILABLE`` to pass lists instead of ndarrays, which the interpreter
+indexes much faster.
+"""
+
+from __future__ import annotations
+
+try:  # pragma: no cover - exercised only when numba is installed
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Fallback decorator that leaves the function uncompiled."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]
@@ -0,0 +1,169 @@
+"""
+Simulation kernel for the backtest engine.
+
+The fill loop is written against plain arrays and scalars only, so it can be
+compiled to native code with Numba when that package is installed.  Numba is
+an optional dependency: without it the very same function runs as ordinary
+Python over lists, which is still far cheaper than per-bar pandas indexing.
+
+Signals are encoded as int8 codes: ``1`` buy, ``-1`` sell and ``0`` hold.
+The strategy is long-only with all-in sizing, matching ``BacktestEngine``.
+The module also provides single-pass metric kernels over the equity curve so
+the engine does not materialise return, running-max or drawdown temporaries.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+from .._jit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def _simulate(prices, signals, initial_capital, slippage_pct, fee):
+    n = len(prices)
+    equity = np.empty(n, dtype=np.float64)
+    # At most one fill per bar plus the final forced exit
+    trade_bar = np.empty(n + 1, dtype=np.int64)
+    trade_side = np.empty(n + 1, dtype=np.int8)
+    trade_price = np.empty(n + 1, dtype=np.float64)
+    trade_qty = np.empty(n + 1, dtype=np.float64)
+    n_trades = 0
+    capital = initial_capital
+    position = 0.0
+    for i in range(n):
+        price = prices[i]
+        signal = signals[i]
+        if signal == 1 and position == 0:
+            unit_price = price * (1 + slippage_pct)
+            qty = (capital - fee) / unit_price
+            if qty > 0:
+                position = qty
+                capital -= qty * unit_price + fee
+                trade_bar[n_trades] = i
+                trade_side[n_trades] = 1
+                trade_price[n_trades] = unit_price
+                trade_qty[n_trades] = qty
+                n_trades += 1
+        elif signal == -1 and position > 0:
+            unit_price = price * (1 - slippage_pct)
+            capital += position * unit_price - fee
+            trade_bar[n_trades] = i
+            trade_side[n_trades] = -1
+            trade_price[n_trades] = unit_price
+            trade_qty[n_trades] = position
+            n_trades += 1
+            position = 0.0
+        equity[i] = capital + position * price
+    # Close any open position at the end
+    if position > 0:
+        unit_price = prices[n - 1] * (1 - slippage_pct)
+        capital += position * unit_price - fee
+        trade_bar[n_trades] = n - 1
+        trade_side[n_trades] = -1
+        trade_price[n_trades] = unit_price
+        trade_qty[n_trades] = position
+        n_trades += 1
+        equity[n - 1] = capital
+    return (
+        equity,
+        trade_bar[:n_trades],
+        trade_side[:n_trades],
+        trade_price[:n_trades],
+        trade_qty[:n_trades],
+    )
+
+
+def simulate(
+    prices: np.ndarray,
+    signals: np.ndarray,
+    initial_capital: float,
+    slippage_pct: float,
+    fee: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Run the long-only fill simulation.
+
+    Parameters
+    ----------
+    prices:
+        Close prices as a float64 array.
+    signals:
+        Signal codes as an int8 array of the same length.
+    initial_capital, slippage_pct, fee:
+        Starting cash, proportional slippage and flat fee per fill.
+
+    Returns
+    -------
+    Tuple[np.ndarray, ...]
+        The equity curve followed by the bar index, side code, fill price and
+        quantity of every trade.
+    """
+    if NUMBA_AVAILABLE:
+        return _simulate(prices, signals, float(initial_capital), float(slippage_pct), float(fee))
+    # Interpreted fallback: indexing Python lists is much cheaper than ndarrays
+    return _simulate(prices.tolist(), signals.tolist(), initial_capital, slippage_pct, fee)
+
+
+@njit(cache=True)
+def _max_drawdown(equity):
+    running_max = equity[0]
+    worst = 0.0
+    for x in equity:
+        if x > running_max:
+            running_max = x
+        drawdown = (x - running_max) / running_max
+        if drawdown < worst:
+            worst = drawdown
+    return -worst
+
+
+@njit(cache=True)
+def _return_stats(equity, log_returns):
+    # Welford's online mean/variance over all returns and over losing returns
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    down_count = 0
+    down_mean = 0.0
+    down_m2 = 0.0
+    prev_log = math.log(equity[0]) if log_returns and len(equity) > 0 else 0.0
+    for i in range(1, len(equity)):
+        if log_returns:
+            # log-difference needs one log per bar and no division
+            cur_log = math.log(equity[i])
+            ret = cur_log - prev_log
+            prev_log = cur_log
+        else:
+            ret = (equity[i] - equity[i - 1]) / equity[i - 1]
+        count += 1
+        delta = ret - mean
+        mean += delta / count
+        m2 += delta * (ret - mean)
+        if ret < 0:
+            down_count += 1
+            delta = ret - down_mean
+            down_mean += delta / down_count
+            down_m2 += delta * (ret - down_mean)
+    std = math.sqrt(m2 / count) if count > 0 else 0.0
+    down_std = math.sqrt(down_m2 / down_count) if down_count > 0 else 0.0
+    return mean, std, down_std
+
+
+def max_drawdown(equity: np.ndarray) -> float:
+    """Return the maximum peak-to-trough drawdown of ``equity`` as a positive fraction."""
+    if len(equity) == 0:
+        return 0.0
+    return _max_drawdown(equity if NUMBA_AVAILABLE else equity.tolist())
+
+
+def return_stats(equity: np.ndarray, log_returns: bool = False) -> Tuple[float, float, float]:
+    """Return the mean and population standard deviation of per-bar returns
+    together with the standard deviation of the negative returns only.
+
+    With ``log_returns`` the per-bar returns are log differences of equity
+    rather than simple percentage changes.
+    """
+    return _return_stats(equity if NUMBA_AVAILABLE else equity.tolist(), log_returns)
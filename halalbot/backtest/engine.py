@@ -19,6 +19,10 @@ Example:
 
 The ``strategy`` object passed to ``run_backtest`` must implement a
 ``generate_signal`` method with signature ``generate_signal(data: pandas.DataFrame, index: int) -> str``.
+Strategies whose signals can be computed for the whole series at once may
+additionally implement ``generate_signals(data: pandas.DataFrame) -> numpy.ndarray``
+returning one code per bar (``1`` buy, ``-1`` sell, ``0`` hold); the engine
+then skips the per-bar calls entirely.
 """
 
 from __future__ import annotations
@@ -30,6 +34,15 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 import pandas as pd
 
+from ._sim import max_drawdown as compute_max_drawdown, return_stats, simulate
+
+# Integer encoding of strategy signals used by the simulation loop
+SIGNAL_CODES: Dict[str, int] = {"buy": 1, "sell": -1, "hold": 0}
+
+# Column layout of the 2-D price arrays accepted by ``run_backtest_fast``
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+CLOSE_COLUMN = OHLCV_COLUMNS.index("close")
+
 
 @dataclass
 class Trade:
@@ -51,6 +64,7 @@ class BacktestEngine:
         slippage_model: str = "fixed_pct",
         slippage_value: float = 0.0005,
         fee_per_trade: float = 0.0,
+        log_returns: bool = False,
     ) -> None:
         """
         Parameters
@@ -65,11 +79,16 @@ class BacktestEngine:
             The magnitude of slippage according to the chosen model.
         fee_per_trade : float, optional
             Flat commission applied to each buy or sell order.
+        log_returns : bool, optional
+            Compute the Sharpe and Sortino moments from log returns instead of
+            simple percentage returns.  Log returns avoid a division per bar and
+            are nearly identical for small moves.
         """
         self.initial_capital = initial_capital
         self.slippage_model = slippage_model
         self.slippage_value = slippage_value
         self.fee_per_trade = fee_per_trade
+        self.log_returns = log_returns
 
     def run_backtest(
         self, data: pd.DataFrame, strategy: Any
@@ -82,7 +101,8 @@ class BacktestEngine:
             A pandas DataFrame indexed by time with at least a ``close`` column.
         strategy:
             An object with a ``generate_signal(data, index)`` method returning
-            "buy", "sell" or "hold" for each bar.
+            "buy", "sell" or "hold" for each bar, optionally also providing a
+            vectorised ``generate_signals(data)`` (see module docstring).
 
         Returns
         -------
@@ -92,12 +112,46 @@ class BacktestEngine:
         """
         if "close" not in data.columns:
             raise ValueError("price data must contain a 'close' column")
-        capital = self.initial_capital
-        position_size: float = 0.0  # number of units currently held
-        equity_curve: List[float] = []
-        blotter: List[Trade] = []
+        # Generate every signal up front, then simulate over plain arrays
+        signals = self.collect_signals(data, strategy)
+        prices = data["close"].to_numpy(dtype=np.float64)
+        return self.run_backtest_fast(prices, data.index, signals)
+
+    def run_backtest_fast(
+        self, ohlcv: np.ndarray, timestamps: Any, signals: np.ndarray
+    ) -> Dict[str, Any]:
+        """Simulate trading over pre-extracted price arrays.
+
+        This is the array-only core of :meth:`run_backtest`.  Callers that
+        already hold contiguous NumPy price data can use it directly and skip
+        all DataFrame column access.
+
+        Parameters
+        ----------
+        ohlcv:
+            Either a 1-D array of close prices or a 2-D float array whose
+            columns follow ``OHLCV_COLUMNS``.
+        timestamps:
+            One label per bar (a pandas Index or any array-like); used only
+            to stamp the fills in the order blotter.
+        signals:
+            One signal code per bar (``1`` buy, ``-1`` sell, ``0`` hold), for
+            example from :meth:`collect_signals`.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The same report as :meth:`run_backtest`.
+        """
+        ohlcv = np.asarray(ohlcv, dtype=np.float64)
+        prices = np.ascontiguousarray(ohlcv[:, CLOSE_COLUMN] if ohlcv.ndim == 2 else ohlcv)
+        signals = np.asarray(signals, dtype=np.int8)
+        if len(signals) != len(prices):
+            raise ValueError("signals must contain one code per bar")
+        if not isinstance(timestamps, pd.Index):
+            timestamps = pd.Index(timestamps)
         # Precompute whether data index is datetime for metrics scaling
-        is_datetime_index = isinstance(data.index, pd.DatetimeIndex)
+        is_datetime_index = isinstance(timestamps, pd.DatetimeIndex)
 
         # Determine slippage percentage based on selected model
         if self.slippage_model == "bps":
@@ -105,49 +159,28 @@ class BacktestEngine:
         else:  # default fixed_pct
             slippage_pct = self.slippage_value
 
-        for i in range(len(data)):
-            price = float(data["close"].iloc[i])
-            signal = "hold"
-            # Let the strategy decide what to do; catch errors to avoid halting the loop
-            try:
-                signal = strategy.generate_signal(data, i)
-            except Exception:
-                signal = "hold"
-            # Execute orders
-            if signal == "buy" and position_size == 0:
-                # Determine how many units we can buy
-                unit_price = price * (1 + slippage_pct)
-                qty = (capital - self.fee_per_trade) / unit_price
-                if qty > 0:
-                    position_size = qty
-                    capital -= qty * unit_price + self.fee_per_trade
-                    blotter.append(
-                        Trade(timestamp=data.index[i], action="buy", price=unit_price, quantity=qty)
-                    )
-            elif signal == "sell" and position_size > 0:
-                unit_price = price * (1 - slippage_pct)
-                capital += position_size * unit_price - self.fee_per_trade
-                blotter.append(
-                    Trade(timestamp=data.index[i], action="sell", price=unit_price, quantity=position_size)
-                )
-                position_size = 0.0
-            # Update equity
-            equity = capital + position_size * price
-            equity_curve.append(equity)
-
-        # Close any open position at the end
-        if position_size > 0:
-            price = float(data["close"].iloc[-1])
-            unit_price = price * (1 - slippage_pct)
-            capital += position_size * unit_price - self.fee_per_trade
-            blotter.append(
-                Trade(timestamp=data.index[-1], action="sell", price=unit_price, quantity=position_size)
+        # Run the fill loop in the (optionally compiled) simulation kernel
+        equity_array, trade_bars, trade_sides, trade_prices, trade_qtys = simulate(
+            prices, signals, self.initial_capital, slippage_pct, self.fee_per_trade
+        )
+        equity_curve: List[float] = equity_array.tolist()
+        # Build the order blotter straight from the filled prefix of the trade
+        # arrays (same fields as ``Trade``) without instantiating dataclasses;
+        # all fill timestamps come from a single take on the index
+        fill_times = timestamps.take(trade_bars)
+        blotter: List[Dict[str, Any]] = [
+            {
+                "timestamp": ts,
+                "action": "buy" if side == 1 else "sell",
+                "price": price,
+                "quantity": qty,
+            }
+            for ts, side, price, qty in zip(
+                fill_times, trade_sides.tolist(), trade_prices.tolist(), trade_qtys.tolist()
             )
-            position_size = 0.0
-            equity_curve[-1] = capital
+        ]
 
         # Compute performance metrics
-        equity_array = np.array(equity_curve)
         total_return = (equity_array[-1] / self.initial_capital) - 1.0
         # Assume daily bars if datetime index; else use bar count as days
         n_periods = len(equity_array)
@@ -156,19 +189,13 @@ class BacktestEngine:
             annual_factor = math.sqrt(252 / n_periods) if n_periods > 0 else 0
         else:
             annual_factor = math.sqrt(252 / n_periods) if n_periods > 0 else 0
-        # Compute returns
-        pct_changes = np.diff(equity_array) / equity_array[:-1]
-        mean_ret = np.mean(pct_changes) if len(pct_changes) > 0 else 0.0
-        std_ret = np.std(pct_changes) if len(pct_changes) > 0 else 0.0
+        # Return moments and downside deviation in one pass over the curve
+        mean_ret, std_ret, std_down = return_stats(equity_array, self.log_returns)
         sharpe = (mean_ret / std_ret) * math.sqrt(252) if std_ret > 0 else 0.0
         # Sortino ratio: use downside deviation
-        downside = pct_changes[pct_changes < 0]
-        std_down = np.std(downside) if len(downside) > 0 else 0.0
         sortino = (mean_ret / std_down) * math.sqrt(252) if std_down > 0 else 0.0
         # Max drawdown
-        running_max = np.maximum.accumulate(equity_array)
-        drawdowns = (equity_array - running_max) / running_max
-        max_drawdown = abs(np.min(drawdowns)) if len(drawdowns) > 0 else 0.0
+        max_drawdown = compute_max_drawdown(equity_array)
         # Calmar ratio: annualized return / max drawdown
         ann_ret = ((equity_array[-1] / self.initial_capital) ** (252 / max(n_periods, 1))) - 1.0 if n_periods > 0 else 0.0
         calmar = ann_ret / max_drawdown if max_drawdown > 0 else 0.0
@@ -186,7 +213,36 @@ class BacktestEngine:
             "initial_capital": self.initial_capital,
             "final_equity": equity_array[-1] if len(equity_array) > 0 else self.initial_capital,
             "total_trades": len(blotter),
-            "trades": [trade.__dict__ for trade in blotter],
+            "trades": blotter,
             "equity_curve": equity_curve,
             "performance_metrics": performance_metrics,
         }
+
+    @staticmethod
+    def collect_signals(data: pd.DataFrame, strategy: Any) -> np.ndarray:
+        """Return one int8 signal code per bar of ``data``.
+
+        Uses the strategy's vectorised ``generate_signals`` when available and
+        otherwise falls back to calling ``generate_signal`` bar by bar.
+        """
+        if hasattr(strategy, "generate_signals"):
+            signals = np.asarray(strategy.generate_signals(data), dtype=np.int8)
+            if len(signals) != len(data):
+                raise ValueError("generate_signals must return one signal per bar")
+            return signals
+        n = len(data)
+        codes = [0] * n
+        generate_signal = strategy.generate_signal
+        code_of = SIGNAL_CODES.get
+        # Run the bars under a single try block rather than one per bar.  If
+        # the strategy raises, that bar stays "hold" and the loop resumes from
+        # the next bar, so errors never halt the backtest.
+        i = 0
+        while i < n:
+            try:
+                for i in range(i, n):
+                    codes[i] = code_of(generate_signal(data, i), 0)
+                break
+            except Exception:
+                i += 1
+        return np.array(codes, dtype=np.int8)
@@ -1,68 +1,347 @@
 """
-Simple broker gateway for paper trading using Alpaca.
+Full-featured broker gateway for Alpaca.
 
-This gateway demonstrates how you could wrap a broker API to place orders and
-query account information.  It uses the `alpaca-py` SDK to send
-market orders to Alpaca's paper trading endpoint.  To use this class you
-need to set the environment variables ``ALPACA_API_KEY`` and
-``ALPACA_SECRET_KEY`` or pass them explicitly when constructing the gateway.
+``EnhancedAlpacaBrokerGateway`` wraps Alpaca's trading and market data REST
+APIs with a shared connection pool, token-bucket rate limiting, short-lived
+caching of slowly changing reads, position reconciliation and fill lookup.
+``MockBrokerGateway`` mimics the same interface for tests and dry runs.  The
+simple ``AlpacaBrokerGateway`` lives in :mod:`halalbot.gateway.broker_gateway`
+and is re-exported here for backwards compatibility.  Credentials are read
+from ``ALPACA_API_KEY`` and ``ALPACA_SECRET_KEY`` unless passed explicitly.
 
 Example
 -------
-    from halalbot.broker_gateway import AlpacaBrokerGateway
+    from halalbot.broker_gateway import EnhancedAlpacaBrokerGateway
 
-    broker = AlpacaBrokerGateway()
-    await broker.place_order("AAPL", "buy", 10)
-    equity = await broker.get_account_value()
-    print(equity)
+    async with EnhancedAlpacaBrokerGateway(paper_trading=True) as broker:
+        await broker.place_order("AAPL", "buy", 10)
+        print(await broker.get_portfolio_value())
 """
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
-from typing import Optional
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import aiohttp
+import numpy as np
+import pandas as pd
 
+try:  # ijson is optional; it lets get_bars_np parse bars while they stream in
+    import ijson
+except ImportError:  # pragma: no cover - fall back to parsing the whole body
+    ijson = None
 
-class AlpacaBrokerGateway:
-    """Asynchronous broker gateway for Alpaca paper trading."""
+# The JSON codec (orjson when installed) is shared with the simple gateway
+from .gateway.broker_gateway import JSON_HEADERS, json_dumps, json_loads
+from .gateway.broker_gateway import AlpacaBrokerGateway  # noqa: F401
 
-    BASE_URL = "https://paper-api.alpaca.markets"
+# Column of each Alpaca bar field in the OHLCV arrays built by get_bars_np
+BAR_FIELDS = {"o": 0, "h": 1, "l": 2, "c": 3, "v": 4}
 
-    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None) -> None:
+
+@dataclass(frozen=True)
+class AccountSnapshot:
+    """Numeric account balances taken from one ``/v2/account`` response"""
+    
+    equity: float
+    buying_power: float
+    portfolio_value: float
+    unrealized_pl: float
+    unrealized_plpc: float
+    realized_pl: float
+    
+    @classmethod
+    def from_account(cls, account: Dict[str, Any]) -> "AccountSnapshot":
+        """Parse Alpaca's string-encoded balance fields"""
+        return cls(
+            equity=float(account.get('equity', 0)),
+            buying_power=float(account.get('buying_power', 0)),
+            portfolio_value=float(account.get('portfolio_value', 0)),
+            unrealized_pl=float(account.get('unrealized_pl', 0)),
+            unrealized_plpc=float(account.get('unrealized_plpc', 0)),
+            realized_pl=float(account.get('realized_pl', 0))
+        )
+
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter that allows short bursts across coroutines"""
+    
+    def __init__(self, rate: float, capacity: int = 5) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Take one token, sleeping until the bucket has refilled enough"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                # Refill lazily from the time elapsed since the last acquire
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class EnhancedAlpacaBrokerGateway:
+    """Full-featured Alpaca gateway with market data, fills and reconciliation"""
+    
+    PAPER_URL = "https://paper-api.alpaca.markets"
+    LIVE_URL = "https://api.alpaca.markets"
+    DATA_URL = "https://data.alpaca.markets"
+    MAX_SYMBOLS_PER_REQUEST = 100
+    
+    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None,
+                 paper_trading: bool = True, max_requests_per_minute: int = 200,
+                 connector: Optional[aiohttp.BaseConnector] = None) -> None:
         self.api_key = api_key or os.getenv("ALPACA_API_KEY")
         self.api_secret = api_secret or os.getenv("ALPACA_SECRET_KEY")
         if not self.api_key or not self.api_secret:
             raise ValueError("Alpaca API credentials are required")
-
-    async def _request(self, method: str, path: str, json: Optional[dict] = None) -> dict:
-        headers = {
+        
+        # Credentials never change, so they are sent as session defaults
+        self._default_headers = {
             "APCA-API-KEY-ID": self.api_key,
-            "APCA-API-SECRET-KEY": self.api_secret,
+            "APCA-API-SECRET-KEY": self.api_secret
         }
-        url = f"{self.BASE_URL}{path}"
-        async with aiohttp.ClientSession() as session:
-            async with session.request(method, url, headers=headers, json=json, timeout=15) as resp:
-                resp.raise_for_status()
-                return await resp.json()
-
-    async def get_account_value(self) -> float:
-        """Return the current equity in the Alpaca account."""
-        data = await self._request("GET", "/v2/account")
-        return float(data.get("equity", 0.0))
-
-    async def place_order(self, symbol: str, side: str, qty: float, order_type: str = "market", time_in_force: str = "day") -> dict:
-        """Place a market order and return the order response."""
+        
+        self.paper_trading = paper_trading
+        self.base_url = self.PAPER_URL if paper_trading else self.LIVE_URL
+        self.data_url = self.DATA_URL
+        
+        # Shared session, created lazily inside the running event loop.  A
+        # caller-supplied connector lets several gateways share one pool of
+        # keep-alive connections; the caller then owns and closes it
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._connector = connector
+        # Fail fast on a stuck connect or TLS handshake instead of burning
+        # the whole request budget on it
+        self._timeout = aiohttp.ClientTimeout(total=15, connect=3, sock_connect=3, sock_read=10)
+        
+        # Alpaca meters order writes separately from reads and market data,
+        # so each gets its own bucket and neither starves the other
+        rate = max_requests_per_minute / 60.0
+        self._rate_limiter = AsyncTokenBucket(rate=rate, capacity=5)
+        self._order_rate_limiter = AsyncTokenBucket(rate=rate, capacity=5)
+        
+        # Short-lived cache for slowly changing reads (clock, calendar, account)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # GETs currently on the wire, keyed by path and params
+        self._inflight: Dict[Tuple[str, Tuple[Any, ...]], asyncio.Future] = {}
+        
+        # True while an authorized order update socket is open
+        self.order_stream_connected = False
+        
+        mode = "paper" if paper_trading else "LIVE"
+        logging.info(f"🏦 Alpaca broker gateway initialized ({mode} trading)")
+    
+    async def _ensure_session(self):
+        """Create the HTTP session if it does not exist yet"""
+        if self.session is None or self.session.closed:
+            # One pool serves both the trading and the market-data hosts;
+            # cached DNS and long keep-alive spare repeat handshakes to each
+            connector = self._connector or aiohttp.TCPConnector(
+                limit=100, limit_per_host=30, ttl_dns_cache=300,
+                keepalive_timeout=90, force_close=False)
+            self.session = aiohttp.ClientSession(headers=self._default_headers,
+                                                 connector=connector, timeout=self._timeout,
+                                                 connector_owner=self._connector is None)
+    
+    async def _cached(self, key: str, ttl: float,
+                      coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a cached value younger than ``ttl`` seconds or fetch a fresh one"""
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        value = await coro_factory()
+        self._cache[key] = (time.monotonic(), value)
+        return value
+    
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one cached entry, or the whole cache when no key is given"""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+    
+    async def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                       json: Optional[Dict[str, Any]] = None) -> Any:
+        """Send an authenticated request, coalescing concurrent identical GETs"""
+        if method != "GET":
+            # Orders and cancellations must never be merged
+            return await self._send(method, path, params, json)
+        
+        key = (path, tuple(sorted(params.items())) if params else ())
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(method, path, params, json))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._inflight.pop(key, None)
+                                   if self._inflight.get(key) is done else None)
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+    
+    async def _send(self, method: str, path: str, params: Optional[Dict[str, Any]],
+                    json: Optional[Dict[str, Any]]) -> Any:
+        """Perform one HTTP request against the trading API"""
+        url = f"{self.base_url}{path}"
+        
+        await self._ensure_session()
+        limiter = self._rate_limiter if method == "GET" else self._order_rate_limiter
+        await limiter.acquire()
+        
+        # Bodies are encoded with json_dumps rather than aiohttp's json= path
+        body = json_dumps(json) if json is not None else None
+        headers = JSON_HEADERS if body is not None else None
+        async with self.session.request(method, url, params=params, data=body,
+                                        headers=headers) as response:
+            response.raise_for_status()
+            if response.status == 204:
+                return {}
+            return json_loads(await response.read())
+    
+    async def health_check(self) -> bool:
+        """Check that the trading API is reachable"""
+        try:
+            await self.get_account()
+            return True
+        except Exception as e:
+            logging.error(f"❌ Broker health check failed: {e}")
+            return False
+    
+    async def get_account(self) -> Dict[str, Any]:
+        """Get account information"""
+        return await self._cached("account", 2, lambda: self._request("GET", "/v2/account"))
+    
+    async def get_positions(self) -> List[Dict[str, Any]]:
+        """Get all open positions"""
+        return await self._request("GET", "/v2/positions")
+    
+    async def place_order(self, symbol: str, side: str, qty: float,
+                          order_type: str = "market", time_in_force: str = "day",
+                          limit_price: Optional[float] = None,
+                          stop_price: Optional[float] = None,
+                          client_order_id: Optional[str] = None) -> Dict[str, Any]:
+        """Submit an order, returning the broker response or an error message"""
         order = {
             "symbol": symbol,
             "qty": str(qty),
             "side": side,
             "type": order_type,
-            "time_in_force": time_in_force,
+            "time_in_force": time_in_force
         }
-        return await self._request("POST", "/v2/orders", json=order)
-type
+        if limit_price is not None:
+            order["limit_price"] = str(limit_price)
+        if stop_price is not None:
+            order["stop_price"] = str(stop_price)
+        if client_order_id:
+            order["client_order_id"] = client_order_id
+        
+        try:
+            result = await self._request("POST", "/v2/orders", json=order)
+            # Buying power changes as soon as the order is accepted
+            self.invalidate("account")
+            logging.info(f"📤 Order submitted: {side.upper()} {qty} {symbol} (ID: {result.get('id')})")
+            return result
+        except aiohttp.ClientResponseError as e:
+            logging.error(f"❌ Order rejected for {symbol}: {e.message}")
+            return {"message": e.message, "status": e.status}
+    
+    async def place_orders_batch(self, orders: List[Dict[str, Any]]) -> List[Any]:
+        """Submit several orders concurrently, with responses in input order
+        
+        Alpaca has no multi-order endpoint, so each ``place_order`` keyword
+        dict is sent on the shared session under the order rate limit.
+        Transport errors are returned in place rather than raised.
+        """
+        return await asyncio.gather(
+            *(self.place_order(**order) for order in orders), return_exceptions=True
+        )
+    
+    async def get_order_direct(self, order_id: str) -> Dict[str, Any]:
+        """Get one order from the single-order endpoint (a ~1 KB payload)"""
+        return await self._request("GET", f"/v2/orders/{order_id}")
+    
+    async def get_order(self, order_id: str) -> Dict[str, Any]:
+        """Get order by ID"""
+        return await self.get_order_direct(order_id)
+    
+    async def stream_order_updates(self, callback: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+        """Await ``callback`` for every Alpaca ``trade_updates`` event until cancelled
+        
+        Each event carries the ``event`` name and the full ``order`` object, in
+        the same shape ``get_order`` returns.  The socket gets its own session
+        so the REST pool's request timeout never applies to it, and dropped
+        connections are re-established with capped backoff.  A rejected key
+        raises ``PermissionError`` instead, since reconnecting cannot fix it.
+        ``order_stream_connected`` is true only while an authorized socket is
+        open, so callers can poll in the meantime.
+        """
+        url = self.base_url.replace("https://", "wss://", 1) + "/stream"
+        auth = {"action": "authenticate",
+                "data": {"key_id": self.api_key, "secret_key": self.api_secret}}
+        listen = {"action": "listen", "data": {"streams": ["trade_updates"]}}
+        backoff = 1.0
+        while True:
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.ws_connect(url, heartbeat=30) as ws:
+                        await ws.send_str(json_dumps(auth).decode())
+                        async for msg in ws:
+                            # Alpaca sends trade updates as binary frames
+                            if msg.type not in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                                break
+                            payload = json_loads(msg.data)
+                            stream = payload.get("stream")
+                            if stream == "trade_updates":
+                                await callback(payload["data"])
+                            elif stream == "authorization":
+                                if payload["data"].get("status") != "authorized":
+                                    raise PermissionError("order update stream authorization failed")
+                                await ws.send_str(json_dumps(listen).decode())
+                                self.order_stream_connected = True
+                                logging.info("📡 Streaming order updates")
+                                backoff = 1.0
+            except (asyncio.CancelledError, PermissionError):
+                raise
+            except Exception as e:
+                logging.warning(f"⚠️ Order update stream dropped: {e}")
+            finally:
+                self.order_stream_connected = False
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
+    
+    async def get_orders(self, status: str = "open") -> List[Dict[str, Any]]:
+        """Get orders filtered by status"""
+        return await self._request("GET", "/v2/orders", params={"status": status})
+    
+    async def cancel_order(self, order_id: str) -> bool:
+        """Cancel an open order"""
+        try:
+            await self._request("DELETE", f"/v2/orders/{order_id}")
+            self.invalidate("account")
+            logging.info(f"🚫 Order cancelled: {order_id}")
+            return True
+        except Exception as e:
+            logging.error(f"Error cancelling order {order_id}: {e}")
+            return False
+    
+    async def get_account_activities(self, activity_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get account activities, optionally filtered by activity type"""
+        params = {}
+        if activity_type:
+            params["activity_type"] = activity_type
         
         return await self._request("GET", "/v2/account/activities", params=params)
     
@@ -82,12 +361,13 @@ type
         if date:
             params["date"] = date
         
-        return await self._request("GET", "/v2/calendar", params=params)
+        return await self._cached(f"calendar:{date}", 3600,
+                                  lambda: self._request("GET", "/v2/calendar", params=params))
     
-    async def get_bars(self, symbols: List[str], timeframe: str = "1Day",
-                      start: Optional[str] = None, end: Optional[str] = None,
-                      limit: int = 1000) -> Dict[str, Any]:
-        """Get historical bars"""
+    @staticmethod
+    def _bars_params(symbols: List[str], timeframe: str, start: Optional[str],
+                     end: Optional[str], limit: int) -> Dict[str, Any]:
+        """Build the query parameters for the multi-symbol bars endpoint"""
         params = {
             "symbols": ",".join(symbols),
             "timeframe": timeframe,
@@ -98,79 +378,160 @@ type
             params["start"] = start
         if end:
             params["end"] = end
+        return params
+    
+    async def get_bars(self, symbols: List[str], timeframe: str = "1Day",
+                      start: Optional[str] = None, end: Optional[str] = None,
+                      limit: int = 1000) -> Dict[str, Any]:
+        """Get historical bars"""
+        params = self._bars_params(symbols, timeframe, start, end, limit)
         
         # Use data endpoint for market data
         url = f"{self.data_url}/v2/stocks/bars"
-        headers = {
-            "APCA-API-KEY-ID": self.api_key,
-            "APCA-API-SECRET-KEY": self.api_secret
-        }
         
         await self._ensure_session()
-        await self._rate_limit()
+        await self._rate_limiter.acquire()
         
-        async with self.session.get(url, headers=headers, params=params) as response:
+        async with self.session.get(url, params=params) as response:
             response.raise_for_status()
-            return await response.json()
+            return json_loads(await response.read())
     
-    async def get_latest_quote(self, symbol: str) -> Dict[str, Any]:
-        """Get latest quote for symbol"""
-        url = f"{self.data_url}/v2/stocks/{symbol}/quotes/latest"
-        headers = {
-            "APCA-API-KEY-ID": self.api_key,
-            "APCA-API-SECRET-KEY": self.api_secret
-        }
+    async def get_bars_np(self, symbols: List[str], timeframe: str = "1Day",
+                          start: Optional[str] = None, end: Optional[str] = None,
+                          limit: int = 1000) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get historical bars as preallocated NumPy arrays
+        
+        Returns ``(symbol_codes, timestamps, ohlcv)`` where ``symbol_codes``
+        indexes into ``symbols``, ``timestamps`` is ``datetime64[ns]`` (UTC)
+        and ``ohlcv`` is a float64 array with open, high, low, close and
+        volume columns.  With ``ijson`` installed the body is parsed as it
+        streams in, so no per-bar dicts are ever built.
+        """
+        params = self._bars_params(symbols, timeframe, start, end, limit)
+        url = f"{self.data_url}/v2/stocks/bars"
+        
+        capacity = limit * len(symbols)
+        codes = np.empty(capacity, dtype=np.int32)
+        times = np.empty(capacity, dtype="datetime64[ns]")
+        ohlcv = np.empty((capacity, len(BAR_FIELDS)), dtype=np.float64)
+        symbol_codes = {symbol: code for code, symbol in enumerate(symbols)}
+        n = 0
         
         await self._ensure_session()
-        await self._rate_limit()
+        await self._rate_limiter.acquire()
         
-        async with self.session.get(url, headers=headers) as response:
+        async with self.session.get(url, params=params) as response:
             response.raise_for_status()
-            return await response.json()
+            if ijson is None:
+                payload = json_loads(await response.read())
+                for symbol, bars in payload.get("bars", {}).items():
+                    code = symbol_codes.get(symbol)
+                    if code is None:
+                        # Not one of the requested symbols (e.g. different case)
+                        continue
+                    for bar in bars:
+                        if n == capacity:
+                            break
+                        codes[n] = code
+                        times[n] = np.datetime64(bar["t"].rstrip("Z"), "ns")
+                        for field, column in BAR_FIELDS.items():
+                            ohlcv[n, column] = bar[field]
+                        n += 1
+            else:
+                # Events arrive as ("bars.<SYMBOL>.item[.<field>]", event, value)
+                skipping = False  # inside a bar of a symbol that was not requested
+                async for prefix, event, value in ijson.parse_async(response.content,
+                                                                    use_float=True):
+                    if event == "start_map" and prefix.endswith(".item"):
+                        if n == capacity:
+                            break
+                        code = symbol_codes.get(prefix[5:-5])
+                        skipping = code is None
+                        if not skipping:
+                            codes[n] = code
+                    elif event == "end_map" and prefix.endswith(".item"):
+                        if not skipping:
+                            n += 1
+                        skipping = False
+                    elif skipping:
+                        continue
+                    elif prefix.startswith("bars."):
+                        field = prefix[prefix.rfind(".") + 1:]
+                        column = BAR_FIELDS.get(field)
+                        if column is not None:
+                            ohlcv[n, column] = value
+                        elif field == "t":
+                            times[n] = np.datetime64(value.rstrip("Z"), "ns")
+        
+        return codes[:n], times[:n], ohlcv[:n]
     
-    async def get_latest_trade(self, symbol: str) -> Dict[str, Any]:
-        """Get latest trade for symbol"""
-        url = f"{self.data_url}/v2/stocks/{symbol}/trades/latest"
-        headers = {
-            "APCA-API-KEY-ID": self.api_key,
-            "APCA-API-SECRET-KEY": self.api_secret
-        }
+    async def _get_latest(self, kind: str, symbols: List[str]) -> Dict[str, Any]:
+        """Fetch the latest quotes or trades for many symbols in batched requests"""
+        # Large universes are split into chunks fetched concurrently
+        chunks = [symbols[i:i + self.MAX_SYMBOLS_PER_REQUEST]
+                  for i in range(0, len(symbols), self.MAX_SYMBOLS_PER_REQUEST)]
+        url = f"{self.data_url}/v2/stocks/{kind}/latest"
         
         await self._ensure_session()
-        await self._rate_limit()
         
-        async with self.session.get(url, headers=headers) as response:
-            response.raise_for_status()
-            return await response.json()
+        async def fetch(chunk: List[str]) -> Dict[str, Any]:
+            await self._rate_limiter.acquire()
+            async with self.session.get(url, params={"symbols": ",".join(chunk)}) as response:
+                response.raise_for_status()
+                payload = json_loads(await response.read())
+                return payload.get(kind, {})
+        
+        results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        merged: Dict[str, Any] = {}
+        for result in results:
+            merged.update(result)
+        return merged
+    
+    async def get_latest_quotes(self, symbols: List[str]) -> Dict[str, Any]:
+        """Get latest quotes keyed by symbol"""
+        return await self._get_latest("quotes", symbols)
+    
+    async def get_latest_trades(self, symbols: List[str]) -> Dict[str, Any]:
+        """Get latest trades keyed by symbol"""
+        return await self._get_latest("trades", symbols)
+    
+    async def get_latest_quote(self, symbol: str) -> Dict[str, Any]:
+        """Get latest quote for symbol"""
+        quotes = await self.get_latest_quotes([symbol])
+        return {"symbol": symbol, "quote": quotes.get(symbol, {})}
+    
+    async def get_latest_trade(self, symbol: str) -> Dict[str, Any]:
+        """Get latest trade for symbol"""
+        trades = await self.get_latest_trades([symbol])
+        return {"symbol": symbol, "trade": trades.get(symbol, {})}
     
     async def reconcile_positions(self, expected_positions: Dict[str, float]) -> Dict[str, Any]:
         """Reconcile expected positions with actual broker positions"""
         try:
             actual_positions = await self.get_positions()
-            actual_dict = {pos['symbol']: float(pos['qty']) for pos in actual_positions}
-            
-            discrepancies = {}
+            actual = pd.Series({pos['symbol']: pos['qty'] for pos in actual_positions},
+                               dtype=object).astype(float)
+            expected = pd.Series(expected_positions, dtype=float)
             
-            # Check expected vs actual
-            for symbol, expected_qty in expected_positions.items():
-                actual_qty = actual_dict.get(symbol, 0.0)
-                
-                if abs(expected_qty - actual_qty) > 0.001:  # Account for floating point precision
-                    discrepancies[symbol] = {
-                        'expected': expected_qty,
-                        'actual': actual_qty,
-                        'difference': actual_qty - expected_qty
-                    }
+            # Align both books on the union of symbols, expected ones first
+            symbols = expected.index.union(actual.index, sort=False)
+            expected_qty = expected.reindex(symbols, fill_value=0.0).to_numpy()
+            actual_qty = actual.reindex(symbols, fill_value=0.0).to_numpy()
+            difference = actual_qty - expected_qty
+            mask = np.abs(difference) > 0.001  # Account for floating point precision
+            unexpected = ~symbols.isin(expected.index)
             
-            # Check for unexpected positions
-            for symbol, actual_qty in actual_dict.items():
-                if symbol not in expected_positions and abs(actual_qty) > 0.001:
-                    discrepancies[symbol] = {
-                        'expected': 0.0,
-                        'actual': actual_qty,
-                        'difference': actual_qty,
-                        'unexpected': True
-                    }
+            discrepancies = {}
+            for symbol, exp_qty, act_qty, diff, extra in zip(
+                    symbols[mask], expected_qty[mask].tolist(), actual_qty[mask].tolist(),
+                    difference[mask].tolist(), unexpected[mask].tolist()):
+                discrepancies[symbol] = {
+                    'expected': exp_qty,
+                    'actual': act_qty,
+                    'difference': diff
+                }
+                if extra:
+                    discrepancies[symbol]['unexpected'] = True
             
             if discrepancies:
                 logging.warning(f"⚠️ Position discrepancies found: {len(discrepancies)} symbols")
@@ -182,7 +543,7 @@ type
             return {
                 'reconciled': len(discrepancies) == 0,
                 'discrepancies': discrepancies,
-                'total_positions': len(actual_dict),
+                'total_positions': len(actual),
                 'discrepancy_count': len(discrepancies)
             }
             
@@ -196,11 +557,14 @@ type
                 'discrepancy_count': 0
             }
     
+    async def get_account_snapshot(self) -> AccountSnapshot:
+        """Get the account balances parsed from a single account request"""
+        return AccountSnapshot.from_account(await self.get_account())
+    
     async def get_buying_power(self) -> float:
         """Get available buying power"""
         try:
-            account = await self.get_account()
-            return float(account.get('buying_power', 0))
+            return (await self.get_account_snapshot()).buying_power
         except Exception as e:
             logging.error(f"Error getting buying power: {e}")
             return 0.0
@@ -208,8 +572,7 @@ type
     async def get_portfolio_value(self) -> float:
         """Get total portfolio value"""
         try:
-            account = await self.get_account()
-            return float(account.get('portfolio_value', 0))
+            return (await self.get_account_snapshot()).portfolio_value
         except Exception as e:
             logging.error(f"Error getting portfolio value: {e}")
             return 0.0
@@ -217,7 +580,7 @@ type
     async def is_market_open(self) -> bool:
         """Check if market is currently open"""
         try:
-            clock = await self._request("GET", "/v2/clock")
+            clock = await self._cached("clock", 30, lambda: self._request("GET", "/v2/clock"))
             return clock.get('is_open', False)
         except Exception as e:
             logging.error(f"Error checking market status: {e}")
@@ -226,21 +589,21 @@ type
     async def get_order_fills(self, order_id: str) -> List[Dict[str, Any]]:
         """Get fills for a specific order"""
         try:
+            # The activities endpoint cannot filter by order, so filter here;
+            # FILL activities always carry these fields
             activities = await self.get_account_activities("FILL")
             
-            # Filter fills for this order
-            order_fills = []
-            for activity in activities:
-                if activity.get('order_id') == order_id:
-                    order_fills.append({
-                        'timestamp': activity.get('transaction_time'),
-                        'qty': float(activity.get('qty', 0)),
-                        'price': float(activity.get('price', 0)),
-                        'side': activity.get('side'),
-                        'symbol': activity.get('symbol')
-                    })
-            
-            return order_fills
+            return [
+                {
+                    'timestamp': activity['transaction_time'],
+                    'qty': float(activity['qty']),
+                    'price': float(activity['price']),
+                    'side': activity['side'],
+                    'symbol': activity['symbol']
+                }
+                for activity in activities
+                if activity.get('order_id') == order_id
+            ]
             
         except Exception as e:
             logging.error(f"Error getting order fills: {e}")
@@ -249,13 +612,13 @@ type
     async def get_daily_pnl(self) -> Dict[str, float]:
         """Get daily P&L information"""
         try:
-            account = await self.get_account()
+            snapshot = await self.get_account_snapshot()
             
             return {
-                'unrealized_pnl': float(account.get('unrealized_pl', 0)),
-                'unrealized_pnl_percent': float(account.get('unrealized_plpc', 0)),
-                'realized_pnl': float(account.get('realized_pl', 0)),  # This might not be available
-                'total_pnl': float(account.get('unrealized_pl', 0))  # + realized if available
+                'unrealized_pnl': snapshot.unrealized_pl,
+                'unrealized_pnl_percent': snapshot.unrealized_plpc,
+                'realized_pnl': snapshot.realized_pl,  # This might not be available
+                'total_pnl': snapshot.unrealized_pl  # + realized if available
             }
             
         except Exception as e:
@@ -268,25 +631,32 @@ type
             }
     
     async def close(self):
-        """Close the HTTP session"""
-        if self.session and not self.session.closed:
+        """Close the HTTP session; safe to call more than once"""
+        if self.session is not None and not self.session.closed:
             await self.session.close()
             logging.info("🔌 Broker gateway connection closed")
+        self.session = None
+    
+    async def __aenter__(self) -> "EnhancedAlpacaBrokerGateway":
+        await self._ensure_session()
+        return self
     
-    def __del__(self):
-        """Cleanup on deletion"""
-        if hasattr(self, 'session') and self.session and not self.session.closed:
-            # Note: This will issue a warning in async contexts
-            # Better to use async context manager or explicit close()
-            pass
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
 
 
 class MockBrokerGateway:
     """Mock broker gateway for testing and dry-run mode"""
     
+    MOCK_PRICE = 100.0
+    
     def __init__(self):
         self.orders = {}
-        self.positions = {}
+        # Positions are kept column-wise: a symbol -> slot index plus one
+        # quantity array, grown geometrically as new symbols trade
+        self._symbol_index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._qty = np.zeros(16, dtype=np.float64)
         self.account_value = 100000.0
         self.order_counter = 1000
         
@@ -312,15 +682,32 @@ class MockBrokerGateway:
         self.orders[order_id] = order
         
         # Update mock positions
-        current_qty = self.positions.get(symbol, 0.0)
-        if side == 'buy':
-            self.positions[symbol] = current_qty + qty
-        else:
-            self.positions[symbol] = current_qty - qty
+        slot = self._slot(symbol)
+        self._qty[slot] += qty if side == 'buy' else -qty
         
         logging.info(f"🎭 Mock order placed: {side.upper()} {qty} {symbol} (ID: {order_id})")
         return order
     
+    async def place_orders_batch(self, orders: List[Dict[str, Any]]) -> List[Any]:
+        """Simulate batch placement, with responses in input order"""
+        return [await self.place_order(**order) for order in orders]
+    
+    def _slot(self, symbol: str) -> int:
+        """Return the array slot for ``symbol``, allocating one if needed"""
+        slot = self._symbol_index.get(symbol)
+        if slot is None:
+            slot = len(self._symbols)
+            if slot == len(self._qty):
+                self._qty = np.concatenate([self._qty, np.zeros_like(self._qty)])
+            self._symbol_index[symbol] = slot
+            self._symbols.append(symbol)
+        return slot
+    
+    @property
+    def positions(self) -> Dict[str, float]:
+        """Net quantity per symbol that has traded"""
+        return dict(zip(self._symbols, self._qty[:len(self._symbols)].tolist()))
+    
     async def get_order(self, order_id: str) -> Dict[str, Any]:
         """Get mock order"""
         return self.orders.get(order_id, {})
@@ -347,25 +734,29 @@ class MockBrokerGateway:
     
     async def get_positions(self) -> List[Dict[str, Any]]:
         """Mock positions"""
-        positions = []
-        for symbol, qty in self.positions.items():
-            if abs(qty) > 0.001:
-                positions.append({
-                    'symbol': symbol,
-                    'qty': str(qty),
-                    'side': 'long' if qty > 0 else 'short',
-                    'market_value': str(abs(qty) * 100),  # Mock value
-                    'avg_entry_price': '100.00',
-                    'unrealized_pl': '0.00'
-                })
-        return positions
+        qty = self._qty[:len(self._symbols)]
+        held = np.flatnonzero(np.abs(qty) > 0.001)
+        held_qty = qty[held]
+        market_value = np.abs(held_qty) * self.MOCK_PRICE  # Mock value
+        symbols = self._symbols
+        return [
+            {
+                'symbol': symbols[slot],
+                'qty': str(q),
+                'side': 'long' if q > 0 else 'short',
+                'market_value': str(value),
+                'avg_entry_price': '100.00',
+                'unrealized_pl': '0.00'
+            }
+            for slot, q, value in zip(held.tolist(), held_qty.tolist(), market_value.tolist())
+        ]
     
     async def reconcile_positions(self, expected_positions: Dict[str, float]) -> Dict[str, Any]:
         """Mock position reconciliation"""
         return {
             'reconciled': True,
             'discrepancies': {},
-            'total_positions': len(self.positions),
+            'total_positions': len(self._symbols),
             'discrepancy_count': 0
         }
     
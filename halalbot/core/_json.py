@@ -0,0 +1,44 @@
+"""
+JSON encoding shared by the persistence helpers in this package.
+
+``orjson`` is used when installed because it encodes and decodes several
+times faster; otherwise the standard library is used.  Both paths accept
+NumPy scalars and arrays, which reach the stores from the vectorised risk
+calculations, and both return compact UTF-8 bytes from :func:`dumps`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import numpy as np
+
+try:  # orjson is optional
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Convert the NumPy values that the JSON encoders do not handle."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON."""
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+else:  # pragma: no cover - exercised only without orjson
+    loads = json.loads
+
+    def dumps(obj: Any) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON."""
+        return json.dumps(obj, separators=(",", ":"), default=_default).encode()
@@ -11,27 +11,75 @@ The engine exposes two main entry points:
     strategy instance.  It passes the data to the backtesting engine and
     returns a performance report.
 
-``run_live``:  An asynchronous coroutine that continually polls for new market
-    data, evaluates screening criteria and risk, generates orders and updates
-    positions.  Only a skeleton implementation is provided here.
+``run_live``:  An asynchronous coroutine that reacts to new market data
+    (streamed bars from Alpaca, or periodic polling when no credentials are
+    configured), evaluates screening criteria and risk, generates orders and
+    updates positions.  Only a skeleton implementation is provided here.
 """
 
 from __future__ import annotations
 
 import asyncio
+import logging
+import os
+import time
+import warnings
+from collections import deque
+from functools import cached_property
+from itertools import islice
+from types import MappingProxyType
 from typing import Any, Dict
 
+import numpy as np
 import pandas as pd
 
+try:  # aiohttp is optional so that backtesting works without it
+    import aiohttp
+    from yarl import URL
+except ImportError:  # pragma: no cover - only live trading needs aiohttp
+    aiohttp = None
+    URL = None
+
+try:  # orjson is optional; it decodes quote and bar payloads several times faster
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - fall back to the standard library
+    from json import loads as json_loads
+
 from .position_store import PositionStore
+from .position_store_sqlite import SQLitePositionStore
 from .risk import RiskManager
 from .trade_executor import EnhancedTradeExecutor
 from .order_manager import OrderManager
-from ..backtest.engine import BacktestEngine
+from ..backtest.engine import OHLCV_COLUMNS, BacktestEngine
 from ..screening.data_gateway import FMPGateway, DataGateway
 from ..screening.halal_rules import load_rules
 from ..screening.advanced_screener import AdvancedHalalScreener
 
+# Financial screening thresholds used when the configuration omits them
+DEFAULT_SCREENER_THRESHOLDS = MappingProxyType({"max_interest_pct": 0.05, "max_debt_ratio": 0.33})
+
+# Alpaca's real-time bar feed for the free IEX data plan
+STREAM_URL = "wss://stream.data.alpaca.markets/v2/iex"
+
+# Stream error codes that reconnecting cannot fix: not authenticated, auth
+# failed, auth timeout, symbol limit, connection limit and no entitlement
+STREAM_FATAL_CODES = frozenset({401, 402, 404, 405, 406, 409})
+
+# Financial Modeling Prep multi-symbol quote endpoint; symbols are appended
+FMP_QUOTE_URL = "https://financialmodelingprep.com/api/v3/quote-short/"
+
+
+# Failures of a halal lookup that are worth retrying later rather than raising
+SCREEN_ERRORS: tuple[type[BaseException], ...] = (asyncio.TimeoutError, LookupError, ValueError)
+if aiohttp is not None:
+    SCREEN_ERRORS += (aiohttp.ClientError,)
+
+
+def _require_aiohttp() -> None:
+    """Raise a clear error when live trading is attempted without aiohttp."""
+    if aiohttp is None:
+        raise ImportError("aiohttp is required for live trading: pip install aiohttp")
+
 
 class TradingEngine:
     """Top level orchestrator for the halalbot trading system."""
@@ -50,8 +98,12 @@ class TradingEngine:
         # Use provided gateway or default to FMPGateway with API key from env
         api_key = config.get("fmp_api_key", "demo")
         self.data_gateway: DataGateway = data_gateway or FMPGateway(api_key)
-        # Persisted positions across sessions
-        self.position_store = PositionStore(config.get("position_file", "positions.json"))
+        # Persisted positions across sessions; a SQLite database when configured
+        position_db = config.get("position_db")
+        if position_db:
+            self.position_store = SQLitePositionStore(position_db)
+        else:
+            self.position_store = PositionStore(config.get("position_file", "positions.json"))
         # Simple risk manager
         self.risk_manager = RiskManager(
             max_portfolio_risk=config.get("max_portfolio_risk", 0.02),
@@ -60,20 +112,6 @@ class TradingEngine:
         )
         # Backtest engine
         self.backtester = BacktestEngine(config.get("initial_capital", 100000))
-        # Load halal rules for crypto screening
-        self.rules = load_rules(config.get("config_path", "config.yaml"))
-
-        # Financial screener using real statements and thresholds
-        # Thresholds (max interest income percentage and debt ratio) are read
-        # from the configuration.  If not present, sensible defaults are used.
-        self.screener = AdvancedHalalScreener(
-            self.data_gateway,
-            {
-                "max_interest_pct": config.get("max_interest_pct", 0.05),
-                "max_debt_ratio": config.get("max_debt_ratio", 0.33),
-            },
-        )
-
         # Enhanced trade executor with order management
         self.trade_executor = EnhancedTradeExecutor(
             broker_gateway=broker_gateway,
@@ -81,101 +119,217 @@ class TradingEngine:
             risk_manager=self.risk_manager,
             is_dry_run=(broker_gateway is None)
         )
+        # Shared HTTP session for price requests, created inside the running loop
+        self._http_session: Any | None = None
+        # Parsed once so aiohttp does not re-parse the quote URL on every request
+        self._quote_base = URL(FMP_QUOTE_URL) if URL is not None else None
+        # Halal verdicts keyed by ticker: (monotonic expiry time, passed)
+        self._halal_cache: dict[str, tuple[float, bool]] = {}
+        self._halal_ttl = config.get("halal_cache_ttl", 86400)
+        # Failed lookups are retried after this many seconds, not every cycle
+        self._halal_retry_ttl = config.get("halal_retry_ttl", 60)
+
+    @cached_property
+    def rules(self) -> Dict[str, Any]:
+        """Halal rules for crypto screening, loaded on first use.
+
+        Backtests never screen, so they skip the YAML parse entirely.
+        """
+        return load_rules(self.config.get("config_path", "config.yaml"))
+
+    @cached_property
+    def screener(self) -> AdvancedHalalScreener:
+        """Financial screener using real statements and thresholds.
+
+        Thresholds (max interest income percentage and debt ratio) are read
+        from the configuration.  If not present, ``DEFAULT_SCREENER_THRESHOLDS``
+        are used.  The screener is built on first use.
+        """
+        thresholds = {
+            **DEFAULT_SCREENER_THRESHOLDS,
+            **{k: self.config[k] for k in DEFAULT_SCREENER_THRESHOLDS if k in self.config},
+        }
+        return AdvancedHalalScreener(self.data_gateway, thresholds)
 
     def run_backtest(self, data: pd.DataFrame) -> Dict[str, Any]:
-        """Run a synchronous backtest on the provided price data."""
-        return self.backtester.run_backtest(data, self.strategy)
+        """Run a synchronous backtest on the provided price data.
+
+        Price columns loaded from JSON or CSV often arrive with ``object``
+        dtype; they are coerced to float64 once here so the strategy and the
+        simulation operate on native buffers.  A string index holding dates
+        is parsed into a ``DatetimeIndex``; any other index is left as is.
+        """
+        coerce = {c: np.float64 for c in OHLCV_COLUMNS if c in data.columns and data[c].dtype != np.float64}
+        if coerce:
+            data = data.astype(coerce)
+        index = data.index
+        if not pd.api.types.is_datetime64_any_dtype(index) and (
+                pd.api.types.is_object_dtype(index) or pd.api.types.is_string_dtype(index)):
+            try:
+                with warnings.catch_warnings():
+                    # Labels that are not dates warn about format inference first
+                    warnings.simplefilter("ignore", UserWarning)
+                    data = data.set_axis(pd.to_datetime(index))
+            except (ValueError, TypeError):
+                pass  # not dates, e.g. bar labels
+        if not set(OHLCV_COLUMNS).issubset(data.columns):
+            return self.backtester.run_backtest(data, self.strategy)
+        # Full OHLCV frames are handed over as one contiguous float64 block
+        # so the simulation never goes back through pandas column access
+        signals = self.backtester.collect_signals(data, self.strategy)
+        ohlcv = data[list(OHLCV_COLUMNS)].to_numpy(dtype=np.float64)
+        return self.backtester.run_backtest_fast(ohlcv, data.index, signals)
 
     async def run_live(self) -> None:
-        """Run the engine in live trading mode."""
-        poll_interval = self.config.get("poll_interval_seconds", 300)
+        """Run the engine in live trading mode.
+
+        When Alpaca credentials are configured the loop is driven by the
+        market data stream: it only wakes when new bars arrive and then
+        handles just the symbols that printed.  Without credentials it falls
+        back to polling, screening ``screen_batch_size`` tickers of the
+        universe in turn every ``poll_interval_seconds``.
+        """
         stock_universe = self.config.get("stock_universe", [])
+        try:
+            if self._stream_credentials() is None:
+                await self._run_polling(stock_universe)
+            else:
+                await self._run_streaming(stock_universe)
+        finally:
+            await self.aclose()
+
+    async def _run_streaming(self, stock_universe: list[str]) -> None:
+        """Process the universe as bars arrive on the market data stream.
+
+        If the stream consumer dies the engine falls back to polling rather
+        than waiting for bars that will never come.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        consumer = asyncio.create_task(self._consume_stream(stock_universe, queue))
+        getter = None
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, consumer}, return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    break
+                bar = getter.result()
+                updated = {bar["S"]}
+                # Fold in any bars that arrived while the last batch ran
+                while not queue.empty():
+                    updated.add(queue.get_nowait()["S"])
+                exits = self._evaluate_positions()
+                if exits:
+                    await self._close_positions(exits)
+                await self._screen_universe([t for t in stock_universe if t in updated])
+        finally:
+            pending = [t for t in (getter, consumer) if t is not None]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        error = consumer.exception() if not consumer.cancelled() else None
+        logging.error("❌ Market data stream stopped (%r); falling back to polling", error)
+        await self._run_polling(stock_universe)
+
+    async def _run_polling(self, stock_universe: list[str]) -> None:
+        """Poll the universe on a fixed interval, one batch per cycle.
+
+        Tickers are screened round-robin so each cycle issues at most
+        ``screen_batch_size`` lookups instead of a burst for the whole
+        universe; every ticker is still visited once per full rotation.
+        """
+        poll_interval = self.config.get("poll_interval_seconds", 300)
+        batch_size = self.config.get("screen_batch_size", 20)
+        screen_queue = deque(stock_universe)
         while True:
-            # Evaluate existing positions
-            await self._evaluate_positions()
-            # Scan for new opportunities
-            await self._screen_universe(stock_universe)
+            # Evaluate existing positions; only exits need the event loop
+            exits = self._evaluate_positions()
+            if exits:
+                await self._close_positions(exits)
+            # Scan the next batch for new opportunities
+            batch = list(islice(screen_queue, batch_size))
+            screen_queue.rotate(-len(batch))
+            await self._screen_universe(batch)
             await asyncio.sleep(poll_interval)
 
     # ------------------------------------------------------------------
-    async def _evaluate_positions(self) -> None:
-        """Check open positions and close them if the strategy signals an exit."""
-        positions = self.position_store.get_open_positions()
-        for symbol, pos in list(positions.items()):
-            # Only proceed if the strategy defines a should_exit method
-            if hasattr(self.strategy, "should_exit"):
-                try:
-                    should_exit = self.strategy.should_exit(pos, None)
-                except Exception:
-                    should_exit = False
-                if should_exit:
-                    # Execute sell order using enhanced trade executor
-                    try:
-                        class MockSignal:
-                            def __init__(self, action, price_target=None, stop_loss=None, confidence=0.5):
-                                self.action = action
-                                self.price_target = price_target
-                                self.stop_loss = stop_loss
-                                self.confidence = confidence
-                        
-                        current_price = pos.get("entry_price", 100.0)  # Fallback price
-                        mock_signal = MockSignal("sell", current_price * 0.98, current_price * 1.05)
-                        
-                        execution_result = await self.trade_executor.execute_trade(
-                            symbol=symbol,
-                            signal=mock_signal,
-                            position_size=pos.get("qty", 0),
-                            is_crypto=False,
-                            strategy_name="exit_signal"
-                        )
-                        
-                        if execution_result and execution_result.success:
-                            self.position_store.close_position(symbol)
-                            logging.info(f"✅ Position closed via trade executor: {symbol}")
-                        else:
-                            logging.warning(f"⚠️ Failed to close position for {symbol}: {execution_result.error_message if execution_result else 'Unknown error'}")
-                            
-                    except Exception as e:
-                        logging.error(f"❌ Error closing position for {symbol}: {e}")
+    def _stream_credentials(self) -> tuple[str, str] | None:
+        """Return the Alpaca key pair used for streaming, if configured."""
+        key = self.config.get("alpaca_api_key") or os.getenv("ALPACA_API_KEY")
+        secret = self.config.get("alpaca_secret_key") or os.getenv("ALPACA_SECRET_KEY")
+        if not key or not secret:
+            return None
+        return key, secret
 
-    # ------------------------------------------------------------------
-    async def _screen_universe(self, universe: list[str]) -> None:
-        """Screen tickers and open new positions when appropriate."""
-        for ticker in universe:
-            # Skip if we already hold this ticker
-            if ticker in self.position_store.get_open_positions():
-                continue
-            # Check if ticker passes the halal screen
+    async def _consume_stream(self, symbols: list[str], queue: asyncio.Queue) -> None:
+        """Push bar events from Alpaca's market data WebSocket onto ``queue``.
+
+        The socket is read in its own task so that slow screening never stalls
+        it.  Dropped connections are re-established with capped backoff, but
+        a rejected key or subscription (see ``STREAM_FATAL_CODES``) raises
+        ``PermissionError`` so that ``_run_streaming`` falls back to polling.
+        """
+        _require_aiohttp()
+        key, secret = self._stream_credentials()
+        url = self.config.get("stream_url", STREAM_URL)
+        backoff = 1.0
+        while True:
             try:
-                is_halal = await self.screener.is_halal(ticker)
-            except Exception:
-                is_halal = False
-            if not is_halal:
-                continue
-            # Retrieve recent price bars to pass into the strategy
-            bars = await self._get_recent_bars(ticker)
-            if bars is None or bars.empty:
-                continue
-            # Ask the strategy for a buy/sell/hold signal using the latest bar index
+                async with aiohttp.ClientSession() as session:
+                    async with session.ws_connect(url, heartbeat=30) as ws:
+                        await ws.send_json({"action": "auth", "key": key, "secret": secret})
+                        authenticated = False
+                        async for msg in ws:
+                            if msg.type != aiohttp.WSMsgType.TEXT:
+                                break
+                            for event in msg.json(loads=json_loads):
+                                kind = event.get("T")
+                                if kind == "b":
+                                    queue.put_nowait(event)
+                                elif kind == "error":
+                                    if not authenticated or event.get("code") in STREAM_FATAL_CODES:
+                                        raise PermissionError(
+                                            f"market data stream rejected: {event.get('msg')} ({event.get('code')})"
+                                        )
+                                    logging.error(f"❌ Stream error: {event.get('msg')}")
+                                elif kind == "success" and event.get("msg") == "authenticated":
+                                    # Subscribing before the key is accepted is refused
+                                    authenticated = True
+                                    await ws.send_json({"action": "subscribe", "bars": symbols})
+                                    logging.info(f"📡 Streaming bars for {len(symbols)} symbols")
+                                    backoff = 1.0
+            except PermissionError:
+                raise
+            except Exception as e:
+                logging.warning(f"⚠️ Market data stream dropped: {e}")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+    # ------------------------------------------------------------------
+    def _evaluate_positions(self) -> list[tuple[str, Dict[str, Any]]]:
+        """Return the open positions the strategy wants to exit.
+
+        This is plain synchronous work, so the live loop only enters a
+        coroutine (``_close_positions``) when there is an order to send.
+        """
+        # Only proceed if the strategy defines a should_exit method
+        should_exit = getattr(self.strategy, "should_exit", None)
+        if should_exit is None:
+            return []
+        exits = []
+        for symbol, pos in self.position_store.get_open_positions().items():
             try:
-                signal = self.strategy.generate_signal(bars, len(bars) - 1)  # type: ignore[arg-type]
+                if should_exit(pos, None):
+                    exits.append((symbol, pos))
             except Exception:
-                signal = "hold"
-            if signal != "buy":
-                continue
-            # Calculate order size (units) using risk manager and actual price
-            latest_price = float(bars["close"].iloc[-1])
-            qty = self.risk_manager.calculate_position_size(
-                account_value=self.config.get("initial_capital", 100000),
-                current_price=latest_price,
-                stop_price=None,
-            )
-            if qty <= 0:
                 continue
-            
-            # Execute trade using enhanced trade executor
+        return exits
+
+    async def _close_positions(self, exits: list[tuple[str, Dict[str, Any]]]) -> None:
+        """Send exit orders for ``exits`` and drop filled ones from the store."""
+        for symbol, pos in exits:
+            # Execute sell order using enhanced trade executor
             try:
-                # Create a mock signal object with the required attributes
                 class MockSignal:
                     def __init__(self, action, price_target=None, stop_loss=None, confidence=0.5):
                         self.action = action
@@ -183,50 +337,207 @@ class TradingEngine:
                         self.stop_loss = stop_loss
                         self.confidence = confidence
                 
-                mock_signal = MockSignal("buy", latest_price * 1.02, latest_price * 0.98)
+                current_price = pos.get("entry_price", 100.0)  # Fallback price
+                mock_signal = MockSignal("sell", current_price * 0.98, current_price * 1.05)
                 
                 execution_result = await self.trade_executor.execute_trade(
-                    symbol=ticker,
+                    symbol=symbol,
                     signal=mock_signal,
-                    position_size=qty,
+                    position_size=pos.get("qty", 0),
                     is_crypto=False,
-                    strategy_name=self.strategy.__class__.__name__
+                    strategy_name="exit_signal"
                 )
                 
                 if execution_result and execution_result.success:
-                    # Record position locally
-                    self.position_store.add_position(
-                        symbol=ticker,
-                        side="long",
-                        qty=execution_result.filled_quantity,
-                        entry_price=execution_result.avg_fill_price or latest_price,
-                        stop=latest_price * 0.98,
-                        target=latest_price * 1.02,
-                        tag=self.strategy.__class__.__name__,
-                    )
-                    logging.info(f"✅ Trade executed and position recorded: {ticker}")
+                    self.position_store.close_position(symbol)
+                    logging.info(f"✅ Position closed via trade executor: {symbol}")
                 else:
-                    logging.warning(f"⚠️ Trade execution failed for {ticker}: {execution_result.error_message if execution_result else 'Unknown error'}")
+                    logging.warning(f"⚠️ Failed to close position for {symbol}: {execution_result.error_message if execution_result else 'Unknown error'}")
                     
             except Exception as e:
-                logging.error(f"❌ Trade execution error for {ticker}: {e}")
+                logging.error(f"❌ Error closing position for {symbol}: {e}")
+
+    # ------------------------------------------------------------------
+    async def _screen_universe(self, universe: list[str]) -> None:
+        """Screen tickers and open new positions when appropriate.
+
+        Tickers are processed concurrently, at most ``screen_concurrency``
+        (default 16) at a time.  Each fill is recorded as soon as its ticker
+        finishes, from this coroutine only, so the store is never written
+        concurrently.
+        """
+        sem = asyncio.Semaphore(self.config.get("screen_concurrency", 16))
+        # Skip tickers we already hold with an indexed membership test each
+        is_open = self.position_store.is_open
+        candidates = [t for t in universe if not is_open(t)]
+        # One batched quote request covers the whole scan
+        prices = await self._get_prices_bulk(candidates) if candidates else {}
+
+        async def process(ticker: str):
+            try:
+                return ticker, await self._process_ticker(ticker, sem, prices.get(ticker))
+            except Exception as e:
+                return ticker, e
+
+        # Act on the fastest tickers first instead of waiting for the slowest
+        for next_done in asyncio.as_completed([process(t) for t in candidates]):
+            ticker, result = await next_done
+            if isinstance(result, Exception):
+                logging.error(f"❌ Trade execution error for {ticker}: {result}")
+                continue
+            if result is None:
+                continue
+            execution_result, latest_price = result
+            if execution_result and execution_result.success:
+                # Record position locally
+                self.position_store.add_position(
+                    symbol=ticker,
+                    side="long",
+                    qty=execution_result.filled_quantity,
+                    entry_price=execution_result.avg_fill_price or latest_price,
+                    stop=latest_price * 0.98,
+                    target=latest_price * 1.02,
+                    tag=self.strategy.__class__.__name__,
+                )
+                logging.info(f"✅ Trade executed and position recorded: {ticker}")
+            else:
+                logging.warning(f"⚠️ Trade execution failed for {ticker}: {execution_result.error_message if execution_result else 'Unknown error'}")
+
+    async def _process_ticker(
+        self, ticker: str, sem: asyncio.Semaphore, quote_price: float | None = None
+    ):
+        """Screen, evaluate and trade one ticker.
+
+        ``quote_price`` is the prefetched latest quote; when missing the last
+        bar close is used for sizing instead.  Returns ``(execution_result, latest_price)`` when an order was sent,
+        otherwise ``None``.
+        """
+        async with sem:
+            # Check if ticker passes the halal screen
+            if not await self._screen_one(ticker):
+                return None
+            # Retrieve recent price bars to pass into the strategy
+            bars = await self._get_recent_bars(ticker)
+            if bars is None or bars.empty:
+                return None
+            # Ask the strategy for a buy/sell/hold signal using the latest bar index
+            try:
+                signal = self.strategy.generate_signal(bars, len(bars) - 1)  # type: ignore[arg-type]
+            except (LookupError, ValueError) as exc:
+                # Malformed or too-short bars; anything else is a strategy bug
+                logging.warning("⚠️ Signal generation failed for %s: %r", ticker, exc)
+                signal = "hold"
+            if signal != "buy":
+                return None
+            # Calculate order size (units) using risk manager and actual price
+            latest_price = quote_price or float(bars["close"].iloc[-1])
+            qty = self.risk_manager.calculate_position_size(
+                account_value=self.config.get("initial_capital", 100000),
+                current_price=latest_price,
+                stop_price=None,
+            )
+            if qty <= 0:
+                return None
+
+            # Create a mock signal object with the required attributes
+            class MockSignal:
+                def __init__(self, action, price_target=None, stop_loss=None, confidence=0.5):
+                    self.action = action
+                    self.price_target = price_target
+                    self.stop_loss = stop_loss
+                    self.confidence = confidence
+
+            mock_signal = MockSignal("buy", latest_price * 1.02, latest_price * 0.98)
+
+            # Execute trade using enhanced trade executor
+            execution_result = await self.trade_executor.execute_trade(
+                symbol=ticker,
+                signal=mock_signal,
+                position_size=qty,
+                is_crypto=False,
+                strategy_name=self.strategy.__class__.__name__
+            )
+            return execution_result, latest_price
+
+    async def _screen_one(self, ticker: str) -> bool:
+        """Check whether ``ticker`` passes the halal screen.
+
+        Verdicts are cached for ``halal_cache_ttl`` seconds (default one day)
+        since the underlying financial statements only change quarterly.
+        Lookups that fail with a network or data error count as a fail and
+        are cached for ``halal_retry_ttl`` seconds (default 60) so a flaky
+        ticker backs off instead of being re-fetched on every pass.
+        """
+        now = time.monotonic()
+        expires_at, verdict = self._halal_cache.get(ticker, (0.0, False))
+        if now < expires_at:
+            return verdict
+        try:
+            verdict = await self.screener.is_halal(ticker)
+        except SCREEN_ERRORS as exc:
+            logging.warning("⚠️ Halal screen failed for %s: %r", ticker, exc)
+            self._halal_cache[ticker] = (now + self._halal_retry_ttl, False)
+            return False
+        self._halal_cache[ticker] = (now + self._halal_ttl, verdict)
+        return verdict
 
     # ------------------------------------------------------------------
+    def _get_http_session(self):
+        """Return the pooled HTTP session, creating it on first use."""
+        _require_aiohttp()
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=20, keepalive_timeout=30, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self._http_session
+
+    async def aclose(self) -> None:
+        """Release the pooled HTTP session and write pending position changes."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+        self.position_store.flush()
+
     async def _get_latest_price(self, ticker: str) -> float | None:
         """Fetch the latest price for ``ticker`` using Financial Modeling Prep."""
+        return (await self._get_prices_bulk([ticker])).get(ticker)
+
+    async def _get_prices_bulk(self, tickers: list[str], chunk_size: int = 100) -> dict[str, float]:
+        """Fetch the latest prices for many tickers with FMP's multi-symbol quotes.
+
+        Tickers are requested ``chunk_size`` at a time and the chunks are
+        fetched concurrently.  Tickers whose chunk fails are simply missing
+        from the result.
+        """
         api_key = self.config.get("fmp_api_key", "demo")
-        url = f"https://financialmodelingprep.com/api/v3/quote-short/{ticker}?apikey={api_key}"
-        import aiohttp  # imported here to avoid making aiohttp a strict dependency for backtesting
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as resp:
+        session = self._get_http_session()
+
+        async def fetch(chunk: list[str]) -> list[dict]:
+            url = (self._quote_base / ",".join(chunk)).with_query(apikey=api_key)
+            try:
+                async with session.get(url) as resp:
                     resp.raise_for_status()
-                    data = await resp.json()
-            if data:
-                return float(data[0].get("price", 0))
-        except Exception:
-            return None
-        return None
+                    payload = json_loads(await resp.read())
+            except Exception:
+                return []
+            if not isinstance(payload, list):
+                # FMP reports errors such as a bad API key as a JSON object
+                logging.warning("⚠️ Unexpected FMP quote payload for %d tickers: %.200r", len(chunk), payload)
+                return []
+            return payload
+
+        chunks = [tickers[i:i + chunk_size] for i in range(0, len(tickers), chunk_size)]
+        prices: dict[str, float] = {}
+        for quotes in await asyncio.gather(*(fetch(chunk) for chunk in chunks)):
+            for quote in quotes:
+                try:
+                    prices[quote["symbol"]] = float(quote.get("price", 0))
+                except (KeyError, TypeError, ValueError, AttributeError):
+                    logging.warning("⚠️ Skipping malformed FMP quote: %.200r", quote)
+        return prices
 
     # ------------------------------------------------------------------
     async def _get_recent_bars(self, ticker: str, interval: str = "5min", limit: int = 50):
@@ -235,13 +546,11 @@ class TradingEngine:
         if not api_key:
             return None
         url = f"https://financialmodelingprep.com/api/v3/historical-chart/{interval}/{ticker}?apikey={api_key}&limit={limit}"
-        import aiohttp
-        import pandas as pd  # imported here to avoid requiring pandas for users who only backtest
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as resp:
-                    resp.raise_for_status()
-                    data = await resp.json()
+            session = self._get_http_session()
+            async with session.get(url) as resp:
+                resp.raise_for_status()
+                data = json_loads(await resp.read())
             if not data:
                 return None
             df = pd.DataFrame(data)
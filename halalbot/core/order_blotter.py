@@ -4,25 +4,80 @@ Order blotter for recording all submitted orders and their statuses.
 This class uses SQLite to persist order information.  Each order has a
 timestamp, symbol, side, quantity, price at which it was submitted, and a
 status field (e.g. ``"submitted"``, ``"filled"``, ``"rejected"``).
+Timestamps are stored as integer microseconds since the Unix epoch (UTC) in
+the ``ts_us`` column.  Records read back carry them both as ``"timestamp"``,
+the ISO-8601 text earlier versions returned, and as the raw ``"ts_us"``.
+Blotters created with the older ISO-text ``timestamp`` column are migrated
+in place when opened.
+
+Code running on the asyncio event loop should use the ``*_async`` writers.
+They run the same statements on a dedicated single worker thread, so a
+commit never stalls the loop.  Every transaction and every fetch takes the
+blotter's lock, so the synchronous and async APIs can be mixed freely and
+readers never see a half-committed batch.
+
+Passing ``flush_size`` or ``flush_interval`` turns on write-behind buffering:
+order ids are assigned up front and rows are committed in one transaction
+once ``flush_size`` writes are pending or ``flush_interval`` seconds have
+passed, whichever comes first.  At most ``flush_interval`` seconds of writes
+are at risk if the process dies; reads and :meth:`OrderBlotter.close` flush
+first.
 """
 
 from __future__ import annotations
 
+import asyncio
 import sqlite3
-from typing import Dict, Any, Optional
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+from datetime import datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def ts_to_iso(ts_us: int) -> str:
+    """Format a microsecond epoch timestamp as a naive UTC ISO-8601 string."""
+    return (_EPOCH + timedelta(microseconds=ts_us)).isoformat()
+
+
+def iso_to_ts(iso: str) -> int:
+    """Parse a naive UTC ISO-8601 string into microseconds since the epoch."""
+    return (datetime.fromisoformat(iso) - _EPOCH) // timedelta(microseconds=1)
 
 
 class OrderBlotter:
     """Simple order blotter backed by SQLite."""
 
-    def __init__(self, filename: str = "orders.db") -> None:
-        self.conn = sqlite3.connect(filename)
+    # Statement text is kept identical across calls so sqlite3's prepared
+    # statement cache is hit instead of re-parsing each write
+    _INSERT_SQL = "INSERT INTO orders (ts_us, symbol, side, qty, price, status) VALUES (?, ?, ?, ?, ?, ?)"
+    _INSERT_WITH_ID_SQL = "INSERT INTO orders (id, ts_us, symbol, side, qty, price, status) VALUES (?, ?, ?, ?, ?, ?, ?)"
+    _UPDATE_SQL = "UPDATE orders SET status = ? WHERE id = ?"
+    _SELECT_SQL = "SELECT id, ts_us, symbol, side, qty, price, status FROM orders"
+    _SELECT_OPEN_SQL = _SELECT_SQL + " WHERE status = 'submitted'"
+    _SELECT_BY_SYMBOL_SQL = _SELECT_SQL + " WHERE symbol = ? ORDER BY ts_us"
+    # Rows fetched per lock acquisition while iterating a query
+    _FETCH_SIZE = 512
+
+    def __init__(self, filename: str = "orders.db", flush_size: int = 0, flush_interval: float = 0.0) -> None:
+        # The async writers use the connection from their worker thread
+        self.conn = sqlite3.connect(filename, check_same_thread=False)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="order-blotter")
+        # WAL with synchronous=NORMAL only fsyncs at checkpoints rather than
+        # on every commit, which keeps bursts of order writes cheap
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        # ~20 MB page cache and a 128 MB memory map for reads
+        self.conn.execute("PRAGMA cache_size=-20000")
+        self.conn.execute("PRAGMA mmap_size=134217728")
         self.conn.execute(
             """
             CREATE TABLE IF NOT EXISTS orders (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT,
+                ts_us INTEGER,
                 symbol TEXT,
                 side TEXT,
                 qty REAL,
@@ -31,39 +86,199 @@ class OrderBlotter:
             )
             """
         )
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(orders)")}
+        if "ts_us" not in columns:
+            self._migrate_timestamps()
+        # Status and per-symbol history lookups use indexes, not table scans
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_orders_symbol_ts_us ON orders(symbol, ts_us)")
         self.conn.commit()
+        # Write-behind buffer; a zero size or interval disables that trigger
+        # and with both at zero every write commits immediately
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._buffered = flush_size > 0 or flush_interval > 0
+        self._lock = threading.Lock()
+        self._pending_inserts: list[tuple] = []
+        self._pending_updates: list[tuple] = []
+        self._oldest_pending = 0.0
+        self._flusher: Optional[asyncio.Task] = None
+        self._next_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM orders").fetchone()[0]
+
+    def _migrate_timestamps(self) -> None:
+        """Add and backfill ``ts_us`` on a blotter that stored ISO text timestamps."""
+        with self.conn:
+            self.conn.execute("ALTER TABLE orders ADD COLUMN ts_us INTEGER")
+            self.conn.execute("DROP INDEX IF EXISTS idx_orders_symbol_ts")
+            rows = self.conn.execute("SELECT id, timestamp FROM orders WHERE timestamp IS NOT NULL").fetchall()
+            self.conn.executemany(
+                "UPDATE orders SET ts_us = ? WHERE id = ?",
+                ((iso_to_ts(ts), order_id) for order_id, ts in rows),
+            )
 
     def add_order(self, symbol: str, side: str, qty: float, price: float, status: str = "submitted") -> int:
         """Insert a new order and return its row id."""
-        ts = datetime.utcnow().isoformat()
-        cur = self.conn.execute(
-            "INSERT INTO orders (timestamp, symbol, side, qty, price, status) VALUES (?, ?, ?, ?, ?, ?)",
-            (ts, symbol, side, qty, price, status),
-        )
-        self.conn.commit()
+        ts = time.time_ns() // 1000
+        if self._buffered:
+            with self._lock:
+                self._mark_pending()
+                order_id = self._next_id
+                self._next_id += 1
+                self._pending_inserts.append((order_id, ts, symbol, side, qty, price, status))
+            self._maybe_flush()
+            return order_id
+        with self._lock, self.conn:
+            cur = self.conn.execute(self._INSERT_SQL, (ts, symbol, side, qty, price, status))
         return cur.lastrowid
 
+    def add_orders_bulk(self, orders: Iterable[Tuple[str, str, float, float, str]]) -> None:
+        """Insert many ``(symbol, side, qty, price, status)`` rows in one transaction."""
+        ts = time.time_ns() // 1000
+        if self._buffered:
+            with self._lock:
+                self._mark_pending()
+                for order in orders:
+                    self._pending_inserts.append((self._next_id, ts, *order))
+                    self._next_id += 1
+            self._maybe_flush()
+            return
+        with self._lock, self.conn:
+            self.conn.executemany(self._INSERT_SQL, ((ts, *order) for order in orders))
+
     def update_status(self, order_id: int, status: str) -> None:
         """Update the status of an existing order."""
-        self.conn.execute(
-            "UPDATE orders SET status = ? WHERE id = ?",
-            (status, order_id),
-        )
-        self.conn.commit()
+        if self._buffered:
+            with self._lock:
+                self._mark_pending()
+                self._pending_updates.append((status, order_id))
+            self._maybe_flush()
+            return
+        with self._lock, self.conn:
+            self.conn.execute(self._UPDATE_SQL, (status, order_id))
+
+    def flush(self) -> None:
+        """Commit all buffered writes in a single transaction."""
+        # Held across the commit so batches land in the order they were taken
+        with self._lock:
+            inserts, self._pending_inserts = self._pending_inserts, []
+            updates, self._pending_updates = self._pending_updates, []
+            if not inserts and not updates:
+                return
+            with self.conn:
+                # Updates may target rows inserted in this same batch
+                self.conn.executemany(self._INSERT_WITH_ID_SQL, inserts)
+                self.conn.executemany(self._UPDATE_SQL, updates)
+
+    def _mark_pending(self) -> None:
+        """Note when the oldest buffered write arrived; call with the lock held."""
+        if not self._pending_inserts and not self._pending_updates:
+            self._oldest_pending = time.monotonic()
+
+    def _maybe_flush(self) -> None:
+        """Flush when the buffer is full or stale, otherwise arm the timer."""
+        pending = len(self._pending_inserts) + len(self._pending_updates)
+        stale = self.flush_interval > 0 and time.monotonic() - self._oldest_pending >= self.flush_interval
+        if 0 < self.flush_size <= pending or stale:
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Start a timed flush on the running event loop, if there is one."""
+        if self.flush_interval <= 0 or self._flusher is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Called off the loop (e.g. from the worker thread); the next
+            # write or the async wrapper arms the timer instead
+            return
+        self._flusher = loop.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """Flush once ``flush_interval`` seconds have passed."""
+        try:
+            await asyncio.sleep(self.flush_interval)
+        finally:
+            self._flusher = None
+        await self.flush_async()
+
+    async def add_order_async(
+        self, symbol: str, side: str, qty: float, price: float, status: str = "submitted"
+    ) -> int:
+        """Like :meth:`add_order`, without blocking the event loop."""
+        order_id = await self._run(self.add_order, symbol, side, qty, price, status)
+        self._schedule_flush()
+        return order_id
+
+    async def add_orders_bulk_async(self, orders: Iterable[Tuple[str, str, float, float, str]]) -> None:
+        """Like :meth:`add_orders_bulk`, without blocking the event loop."""
+        await self._run(self.add_orders_bulk, list(orders))
+        self._schedule_flush()
+
+    async def update_status_async(self, order_id: int, status: str) -> None:
+        """Like :meth:`update_status`, without blocking the event loop."""
+        await self._run(self.update_status, order_id, status)
+        self._schedule_flush()
+
+    async def flush_async(self) -> None:
+        """Like :meth:`flush`, without blocking the event loop."""
+        await self._run(self.flush)
+
+    async def _run(self, func, *args):
+        """Run ``func`` on the blotter's worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def close(self) -> None:
+        """Wait for pending async writes, flush the buffer and close the database."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+        self._executor.shutdown(wait=True)
+        self.flush()
+        self.conn.close()
+
+    def iter_orders(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield ``(id, order)`` pairs lazily, straight off the cursor."""
+        return self._query(self._SELECT_SQL)
 
     def list_orders(self) -> Dict[int, Dict[str, Any]]:
         """Return all orders keyed by their id."""
-        cur = self.conn.execute("SELECT id, timestamp, symbol, side, qty, price, status FROM orders")
-        rows = cur.fetchall()
-        orders: Dict[int, Dict[str, Any]] = {}
-        for row in rows:
-            order_id, ts, symbol, side, qty, price, status = row
-            orders[order_id] = {
-                "timestamp": ts,
+        return dict(self.iter_orders())
+
+    def list_open_orders(self) -> Dict[int, Dict[str, Any]]:
+        """Return orders still in the ``"submitted"`` state, keyed by id."""
+        return dict(self._query(self._SELECT_OPEN_SQL))
+
+    def orders_by_symbol(self, symbol: str) -> Dict[int, Dict[str, Any]]:
+        """Return every order for ``symbol`` in time order, keyed by id."""
+        return dict(self._query(self._SELECT_BY_SYMBOL_SQL, (symbol,)))
+
+    def _query(self, sql: str, params: tuple = ()) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Flush, then run ``sql`` and yield its records as ``(id, order)`` pairs."""
+        self.flush()
+        with self._lock:
+            cur = self.conn.execute(sql, params)
+        return self._iter_records(self._fetch_locked(cur))
+
+    def _fetch_locked(self, cur: sqlite3.Cursor) -> Iterator[tuple]:
+        """Yield the rows of ``cur``, fetching each batch with the lock held."""
+        while True:
+            with self._lock:
+                rows = cur.fetchmany(self._FETCH_SIZE)
+            if not rows:
+                return
+            yield from rows
+
+    @staticmethod
+    def _iter_records(rows: Iterable[tuple]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Convert ``SELECT id, ts_us, ...`` rows into ``(id, order)`` pairs."""
+        for order_id, ts, symbol, side, qty, price, status in rows:
+            yield order_id, {
+                "timestamp": ts_to_iso(ts) if ts is not None else None,
+                "ts_us": ts,
                 "symbol": symbol,
                 "side": side,
                 "qty": qty,
                 "price": price,
                 "status": status,
             }
-        return orders
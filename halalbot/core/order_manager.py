@@ -13,11 +13,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import random
+import time
+import uuid
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from types import MappingProxyType
+from typing import Deque, Dict, Final, List, Mapping, Optional, Any, Callable, Set
 from enum import Enum
 from dataclasses import dataclass, field
-import json
+
+from ._json import dumps as json_dumps
+from .order_journal import OrderJournal
+
+logger = logging.getLogger(__name__)
 
 class OrderStatus(Enum):
     """Order status enumeration"""
@@ -38,9 +48,32 @@ class OrderType(Enum):
     STOP = "stop"
     STOP_LIMIT = "stop_limit"
 
-@dataclass
+# Broker order statuses mapped onto ours; built once, not per update
+_BROKER_STATUS: Final[Dict[str, OrderStatus]] = {
+    'new': OrderStatus.SUBMITTED,
+    'pending_new': OrderStatus.PENDING,
+    'accepted': OrderStatus.SUBMITTED,
+    'partially_filled': OrderStatus.PARTIALLY_FILLED,
+    'filled': OrderStatus.FILLED,
+    'done_for_day': OrderStatus.FILLED,
+    'canceled': OrderStatus.CANCELLED,
+    'cancelled': OrderStatus.CANCELLED,
+    'expired': OrderStatus.EXPIRED,
+    'replaced': OrderStatus.SUBMITTED,
+    'pending_cancel': OrderStatus.PENDING_CANCEL,
+    'pending_replace': OrderStatus.SUBMITTED,
+    'rejected': OrderStatus.REJECTED,
+    'suspended': OrderStatus.FAILED,
+    'stopped': OrderStatus.CANCELLED,
+}
+
+@dataclass(slots=True)
 class EnhancedOrder:
-    """Enhanced order with comprehensive tracking"""
+    """Enhanced order with comprehensive tracking
+    
+    Slotted: instances carry no ``__dict__``, so attributes outside the
+    declared fields cannot be added.
+    """
     symbol: str
     side: str  # "buy" or "sell"
     quantity: float
@@ -51,7 +84,8 @@ class EnhancedOrder:
     
     # Order lifecycle tracking
     order_id: Optional[str] = None
-    client_order_id: str = field(default_factory=lambda: f"order_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}")
+    # Random rather than time-based so orders built in the same microsecond never collide
+    client_order_id: str = field(default_factory=lambda: f"ord_{uuid.uuid4().hex[:16]}")
     status: OrderStatus = OrderStatus.PENDING
     
     # Execution tracking
@@ -96,12 +130,18 @@ class EnhancedOrder:
         """Get fill percentage"""
         return (self.filled_qty / self.quantity) * 100 if self.quantity > 0 else 0.0
     
-    def update_fill(self, fill_qty: float, fill_price: float, fees: float = 0.0):
-        """Update order with fill information"""
+    def update_fill(self, fill_qty: float, fill_price: float, fees: float = 0.0,
+                    now: Optional[datetime] = None):
+        """Update order with fill information
+        
+        ``now`` lets a caller handling one broker update stamp every change
+        with a single clock read.
+        """
+        now = now or datetime.now()
         self.filled_qty += fill_qty
         self.remaining_qty = max(0, self.quantity - self.filled_qty)
         self.fees += fees
-        self.updated_at = datetime.now()
+        self.updated_at = now
         
         # Update average fill price
         if self.avg_fill_price is None:
@@ -114,28 +154,29 @@ class EnhancedOrder:
         # Update status
         if self.remaining_qty <= 0.001:  # Account for floating point precision
             self.status = OrderStatus.FILLED
-            self.filled_at = datetime.now()
+            self.filled_at = now
         else:
             self.status = OrderStatus.PARTIALLY_FILLED
     
-    def mark_submitted(self, order_id: str):
+    def mark_submitted(self, order_id: str, now: Optional[datetime] = None):
         """Mark order as submitted to broker"""
+        now = now or datetime.now()
         self.order_id = order_id
         self.status = OrderStatus.SUBMITTED
-        self.submitted_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.submitted_at = now
+        self.updated_at = now
     
-    def mark_rejected(self, error_message: str):
+    def mark_rejected(self, error_message: str, now: Optional[datetime] = None):
         """Mark order as rejected"""
         self.status = OrderStatus.REJECTED
         self.last_error = error_message
-        self.updated_at = datetime.now()
+        self.updated_at = now or datetime.now()
     
-    def mark_failed(self, error_message: str):
+    def mark_failed(self, error_message: str, now: Optional[datetime] = None):
         """Mark order as failed"""
         self.status = OrderStatus.FAILED
         self.last_error = error_message
-        self.updated_at = datetime.now()
+        self.updated_at = now or datetime.now()
     
     def increment_retry(self) -> bool:
         """Increment retry count and return if more retries allowed"""
@@ -169,19 +210,55 @@ class EnhancedOrder:
             'strategy_name': self.strategy_name,
             'signal_confidence': self.signal_confidence
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EnhancedOrder":
+        """Rebuild an order from :meth:`to_dict` output"""
+        kwargs = dict(data)
+        kwargs['order_type'] = OrderType(kwargs['order_type'])
+        kwargs['status'] = OrderStatus(kwargs['status'])
+        for key in ('created_at', 'submitted_at', 'updated_at', 'filled_at'):
+            if kwargs.get(key):
+                kwargs[key] = datetime.fromisoformat(kwargs[key])
+        return cls(**kwargs)
 
 
 class OrderManager:
-    """Enhanced order manager with fill tracking and retry logic"""
+    """Enhanced order manager with fill tracking and retry logic
     
-    def __init__(self, broker_gateway, order_blotter=None, max_concurrent_orders: int = 50):
+    Status checks go through ``broker.get_order_direct(order_id)`` when the
+    gateway provides it.  That method must hit the broker's single-order
+    endpoint (e.g. Alpaca ``GET /v2/orders/{id}``) rather than listing every
+    order and scanning for the id.  Gateways may raise ``NotImplementedError``
+    from it, in which case ``broker.get_order(order_id)`` is used instead.
+    
+    Active orders are journaled to SQLite (``journal_file``) as they change.
+    Orders still working when the process died are reloaded on construction
+    and monitored again.  Pass ``journal_file=None`` to run without a journal.
+    """
+    
+    def __init__(self, broker_gateway, order_blotter=None, max_concurrent_orders: int = 50,
+                 max_completed_history: int = 10000, order_journal=None,
+                 journal_file: Optional[str] = "positions.db"):
         self.broker = broker_gateway
         self.order_blotter = order_blotter
+        # OrderJournal mirroring every active order for crash recovery
+        self._owns_journal = order_journal is None and journal_file is not None
+        if self._owns_journal:
+            order_journal = OrderJournal(journal_file)
+        self.order_journal = order_journal
         self.max_concurrent_orders = max_concurrent_orders
         
-        # Order tracking
+        # Order tracking, keyed by client_order_id which exists before submission
         self.active_orders: Dict[str, EnhancedOrder] = {}
-        self.completed_orders: List[EnhancedOrder] = []
+        # Broker-assigned order id -> client_order_id, for broker-side lookups
+        self._broker_to_client: Dict[str, str] = {}
+        # Active client order ids per symbol, kept in step with active_orders
+        self._by_symbol: Dict[str, Set[str]] = {}
+        # Monotonic time before which a failed status lookup is not retried
+        self._retry_at: Dict[str, float] = {}
+        # Bounded history: O(1) appends and the oldest orders are evicted
+        self.completed_orders: Deque[EnhancedOrder] = deque(maxlen=max_completed_history)
         self.order_callbacks: Dict[str, List[Callable]] = {}
         
         # Monitoring
@@ -189,6 +266,10 @@ class OrderManager:
         self.monitoring_interval = 2.0  # seconds
         self.monitoring_task: Optional[asyncio.Task] = None
         
+        # Brokers that push order updates are only swept as a fallback
+        self.reconcile_interval = 30.0  # seconds
+        self.stream_task: Optional[asyncio.Task] = None
+        
         # Performance metrics
         self.metrics = {
             'orders_submitted': 0,
@@ -200,94 +281,250 @@ class OrderManager:
             'retry_success_rate': 0.0
         }
         
-        logging.info("✅ Enhanced OrderManager initialized")
+        logger.info("✅ Enhanced OrderManager initialized")
+        
+        if self.order_journal and self.recover_orders():
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass  # monitoring starts with start_monitoring() or the next submit
+            else:
+                self._launch_monitoring()
     
     async def submit_order(self, order: EnhancedOrder, 
                           callback: Optional[Callable] = None) -> bool:
         """Submit order with confirmation and tracking"""
+        return (await self.submit_orders([order], callback))[0]
+    
+    async def submit_orders(self, orders: List[EnhancedOrder],
+                            callback: Optional[Callable] = None) -> List[bool]:
+        """Submit several orders with a single broker batch call
+        
+        Buys are placed ahead of sells.  Returns one success flag per order,
+        in the order given.
+        """
+        results = [False] * len(orders)
+        # Stable two-pass partition: every buy, then every sell
+        queued = [i for i, o in enumerate(orders) if o.side == "buy"]
+        queued += [i for i, o in enumerate(orders) if o.side != "buy"]
+        
+        # Check limits
+        capacity = self.max_concurrent_orders - len(self.active_orders)
+        if len(queued) > capacity:
+            logger.warning("⚠️ Max concurrent orders reached (%d)", self.max_concurrent_orders)
+            for i in queued[max(capacity, 0):]:
+                orders[i].mark_failed("Max concurrent orders exceeded")
+            queued = queued[:max(capacity, 0)]
+        if not queued:
+            return results
+        
+        # Log order blotter if available
+        blotter_ids = [
+            self.order_blotter.add_order(
+                orders[i].symbol, orders[i].side, orders[i].quantity,
+                orders[i].price or 0.0, "pending"
+            ) if self.order_blotter else None
+            for i in queued
+        ]
+
+        # Track orders before the broker call so an update pushed while it is
+        # in flight already finds them
+        for i in queued:
+            self._track(orders[i], callback)
+
+        # Submit to broker
+        payloads = [self._order_payload(orders[i]) for i in queued]
+        if logger.isEnabledFor(logging.INFO):
+            for payload in payloads:
+                logger.info("submit side=%s qty=%s symbol=%s",
+                            payload['side'], payload['qty'], payload['symbol'])
         try:
-            # Check limits
-            if len(self.active_orders) >= self.max_concurrent_orders:
-                logging.warning(f"⚠️ Max concurrent orders reached ({self.max_concurrent_orders})")
-                order.mark_failed("Max concurrent orders exceeded")
-                return False
-            
-            # Log order blotter if available
-            if self.order_blotter:
-                blotter_id = self.order_blotter.add_order(
-                    order.symbol, order.side, order.quantity, 
-                    order.price or 0.0, "pending"
-                )
-            
-            # Submit to broker
-            logging.info(f"📤 Submitting order: {order.side.upper()} {order.quantity} {order.symbol}")
-            
-            broker_response = await self.broker.place_order(
-                symbol=order.symbol,
-                side=order.side,
-                qty=order.quantity,
-                order_type=order.order_type.value,
-                time_in_force=order.time_in_force,
-                limit_price=order.price,
-                stop_price=order.stop_price
-            )
-            
-            # Process broker response
-            if broker_response and broker_response.get('id'):
-                order_id = str(broker_response['id'])
-                order.mark_submitted(order_id)
-                
-                # Add to active orders
-                self.active_orders[order_id] = order
-                
-                # Add callback if provided
-                if callback:
-                    if order_id not in self.order_callbacks:
-                        self.order_callbacks[order_id] = []
-                    self.order_callbacks[order_id].append(callback)
-                
-                # Update blotter
-                if self.order_blotter:
-                    self.order_blotter.update_status(blotter_id, "submitted")
-                
-                # Start monitoring if not active
-                if not self.monitoring_active:
-                    await self.start_monitoring()
-                
-                self.metrics['orders_submitted'] += 1
-                logging.info(f"✅ Order submitted: {order_id}")
-                return True
-                
-            else:
-                error_msg = broker_response.get('message', 'Unknown broker error')
-                order.mark_rejected(error_msg)
-                
-                if self.order_blotter:
-                    self.order_blotter.update_status(blotter_id, "rejected")
-                
-                self.metrics['orders_rejected'] += 1
-                logging.error(f"❌ Order rejected: {error_msg}")
-                return False
-                
+            responses = await self._place_batch(payloads)
         except Exception as e:
-            error_msg = f"Order submission failed: {str(e)}"
-            order.mark_failed(error_msg)
+            responses = [e] * len(queued)
+        
+        now = datetime.now()
+        for i, blotter_id, response in zip(queued, blotter_ids, responses):
+            results[i] = self._record_submission(orders[i], blotter_id, response, now)
+        
+        # Start monitoring if not active
+        if self.active_orders and not self.monitoring_active:
+            await self.start_monitoring()
+        
+        return results
+    
+    @staticmethod
+    def _order_payload(order: EnhancedOrder) -> Dict[str, Any]:
+        """Keyword arguments for ``broker.place_order`` for one order"""
+        return {
+            'symbol': order.symbol,
+            'side': order.side,
+            'qty': order.quantity,
+            'order_type': order.order_type.value,
+            'time_in_force': order.time_in_force,
+            'limit_price': order.price,
+            'stop_price': order.stop_price,
+            'client_order_id': order.client_order_id,
+        }
+
+    def _track(self, order: EnhancedOrder, callback: Optional[Callable] = None):
+        """Add ``order`` to the active orders under its client_order_id"""
+        client_id = order.client_order_id
+        self.active_orders[client_id] = order
+        self._by_symbol.setdefault(order.symbol, set()).add(client_id)
+        if callback:
+            self.order_callbacks.setdefault(client_id, []).append(callback)
+
+    def _untrack(self, order: EnhancedOrder):
+        """Drop ``order`` and everything indexed under it from active tracking"""
+        client_id = order.client_order_id
+        if self.active_orders.pop(client_id, None) is None:
+            return
+        self._retry_at.pop(client_id, None)
+        if order.order_id is not None:
+            self._broker_to_client.pop(order.order_id, None)
+        symbol_ids = self._by_symbol.get(order.symbol)
+        if symbol_ids is not None:
+            symbol_ids.discard(client_id)
+            if not symbol_ids:
+                del self._by_symbol[order.symbol]
+
+    def recover_orders(self) -> int:
+        """Track the orders left in the journal by a previous run
+        
+        Returns the number of orders recovered.
+        """
+        recovered = 0
+        for data in self.order_journal.pending_orders():
+            try:
+                order = EnhancedOrder.from_dict(data)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.error("Skipping unreadable journaled order: %s", e)
+                continue
+            if order.is_complete or order.client_order_id in self.active_orders:
+                continue
+            self._track(order)
+            if order.order_id is not None:
+                self._broker_to_client[order.order_id] = order.client_order_id
+            recovered += 1
+        if recovered:
+            logger.info("♻️ Recovered %d active orders from the journal", recovered)
+        return recovered
+    
+    def _resolve(self, order_id: Optional[str]) -> Optional[EnhancedOrder]:
+        """Find an active order by client_order_id or broker order id"""
+        if order_id is None:
+            return None
+        order = self.active_orders.get(order_id)
+        if order is None:
+            client_id = self._broker_to_client.get(order_id)
+            if client_id is not None:
+                order = self.active_orders.get(client_id)
+        return order
+    
+    async def _place_batch(self, payloads: List[Dict[str, Any]]) -> List[Any]:
+        """Place orders in one broker call, with responses in payload order
+        
+        Brokers without ``place_orders_batch`` get concurrent single-order
+        calls instead.  Failed placements come back as exceptions in place.
+        """
+        place_orders_batch = getattr(self.broker, 'place_orders_batch', None)
+        if place_orders_batch is not None:
+            return await place_orders_batch(payloads)
+        return await asyncio.gather(
+            *(self.broker.place_order(**payload) for payload in payloads),
+            return_exceptions=True
+        )
+    
+    def _record_submission(self, order: EnhancedOrder, blotter_id: Optional[int],
+                           broker_response: Any, now: Optional[datetime] = None) -> bool:
+        """Apply one broker response to ``order``; return True if accepted"""
+        if isinstance(broker_response, Exception):
+            error_msg = f"Order submission failed: {str(broker_response)}"
+            order.mark_failed(error_msg, now)
+            self._untrack(order)
+            self.order_callbacks.pop(order.client_order_id, None)
             
             if self.order_blotter:
                 self.order_blotter.update_status(blotter_id, "failed")
             
             self.metrics['orders_failed'] += 1
-            logging.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             return False
+        
+        # Process broker response
+        if broker_response and broker_response.get('id'):
+            order_id = str(broker_response['id'])
+            if order.status == OrderStatus.PENDING:
+                order.mark_submitted(order_id, now)
+            else:
+                # A pushed update already moved the order on while the call was in flight
+                order.order_id = order_id
+                order.submitted_at = order.submitted_at or now
+            
+            # Index the broker id; a pushed fill may already have completed the order
+            if not order.is_complete:
+                self._broker_to_client[order_id] = order.client_order_id
+                if self.order_journal:
+                    self.order_journal.upsert(order)
+            
+            # Update blotter
+            if self.order_blotter:
+                self.order_blotter.update_status(blotter_id, "submitted")
+            
+            self.metrics['orders_submitted'] += 1
+            logger.info("submitted order_id=%s", order_id)
+            return True
+        
+        error_msg = (broker_response or {}).get('message', 'Unknown broker error')
+        order.mark_rejected(error_msg, now)
+        self._untrack(order)
+        self.order_callbacks.pop(order.client_order_id, None)
+        
+        if self.order_blotter:
+            self.order_blotter.update_status(blotter_id, "rejected")
+        
+        self.metrics['orders_rejected'] += 1
+        logger.error("❌ Order rejected: %s", error_msg)
+        return False
     
     async def start_monitoring(self):
         """Start order monitoring loop"""
+        self._launch_monitoring()
+    
+    def _launch_monitoring(self):
+        """Start the monitoring tasks on the running loop"""
         if self.monitoring_active:
             return
         
         self.monitoring_active = True
+        # Subscribe once; the stream outlives idle periods between orders
+        if self.stream_task is None and hasattr(self.broker, 'stream_order_updates'):
+            self.stream_task = asyncio.create_task(self.broker.stream_order_updates(self._on_push))
+            self.stream_task.add_done_callback(self._on_stream_done)
         self.monitoring_task = asyncio.create_task(self._monitoring_loop())
-        logging.info("🔍 Order monitoring started")
+        logger.info("🔍 Order monitoring started")
+    
+    def _on_stream_done(self, task: asyncio.Task):
+        """Fall back to regular polling once the push stream has stopped
+        
+        The stream is subscribed again the next time monitoring starts.
+        """
+        if task is not self.stream_task:
+            return
+        self.stream_task = None
+        if task.cancelled():
+            return
+        logger.error("Order update stream stopped (%r); polling every %.1fs",
+                     task.exception(), self.monitoring_interval)
+    
+    def _stream_connected(self) -> bool:
+        """Whether pushed order updates are currently arriving"""
+        stream_task = self.stream_task
+        if stream_task is None or stream_task.done():
+            return False
+        # Brokers that do not report their socket state are trusted to be up
+        return getattr(self.broker, 'order_stream_connected', True)
     
     async def stop_monitoring(self):
         """Stop order monitoring loop"""
@@ -298,93 +535,132 @@ class OrderManager:
                 await self.monitoring_task
             except asyncio.CancelledError:
                 pass
-        logging.info("⏹️ Order monitoring stopped")
+        logger.info("⏹️ Order monitoring stopped")
     
     async def _monitoring_loop(self):
-        """Main monitoring loop for order updates"""
+        """Main monitoring loop for order updates
+        
+        While the push stream is connected this is only a slow reconciliation
+        sweep that catches updates missed while it was reconnecting; whenever
+        the stream is down or reconnecting, orders are polled every
+        ``monitoring_interval`` as usual.
+        """
         try:
+            loop = asyncio.get_running_loop()
+            next_sweep = 0.0
             while self.monitoring_active and self.active_orders:
-                await self._check_order_updates()
+                if not self._stream_connected() or loop.time() >= next_sweep:
+                    await self._check_order_updates()
+                    next_sweep = loop.time() + self.reconcile_interval
                 await asyncio.sleep(self.monitoring_interval)
                 
         except asyncio.CancelledError:
-            logging.info("Order monitoring cancelled")
+            logger.info("Order monitoring cancelled")
         except Exception as e:
-            logging.error(f"Order monitoring error: {e}")
+            logger.error("Order monitoring error: %s", e)
         finally:
             self.monitoring_active = False
     
     async def _check_order_updates(self):
-        """Check for order updates from broker"""
+        """Check for order updates from broker
+        
+        Status queries for all active orders are issued concurrently, at most
+        ``max_concurrent_orders`` at a time, so a sweep costs about one round
+        trip rather than one per order.  An order whose lookup failed is left
+        out of sweeps until its jittered exponential backoff has elapsed, so a
+        burst of broker errors does not use up its retries within seconds.
+        """
         if not self.active_orders:
             return
         
         try:
-            # Get order IDs to check
-            order_ids = list(self.active_orders.keys())
+            # Collect the submitted orders to check, skipping those still backing off
+            now = time.monotonic()
+            pending = [(client_id, order) for client_id, order in self.active_orders.items()
+                       if order.order_id is not None and not order.is_complete
+                       and self._retry_at.get(client_id, 0.0) <= now]
+            sem = asyncio.Semaphore(self.max_concurrent_orders)
             
-            for order_id in order_ids:
-                order = self.active_orders.get(order_id)
-                if not order or order.is_complete:
-                    continue
-                
-                try:
-                    # Get order status from broker
-                    broker_order = await self.broker.get_order(order_id)
-                    
-                    if broker_order:
-                        await self._process_order_update(order, broker_order)
-                        
-                except Exception as e:
-                    logging.error(f"Error checking order {order_id}: {e}")
+            async def fetch(order_id: str):
+                async with sem:
+                    return await self._fetch_order(order_id)
+            
+            # Get order status from broker
+            broker_orders = await asyncio.gather(
+                *(fetch(order.order_id) for _, order in pending), return_exceptions=True
+            )
+            
+            for (client_id, order), broker_order in zip(pending, broker_orders):
+                order_id = order.order_id
+                if isinstance(broker_order, Exception):
+                    e = broker_order
+                    logger.error("Error checking order %s: %s", order_id, e)
                     
                     # Check if order should be retried
                     if order.increment_retry():
-                        logging.info(f"🔄 Retrying order {order_id} (attempt {order.retry_count})")
-                        # Could implement retry logic here
+                        delay = self._retry_delay(order.retry_count)
+                        self._retry_at[client_id] = now + delay
+                        logger.info("🔄 Retrying order %s in %.1fs (attempt %d)", order_id, delay, order.retry_count)
                     else:
-                        logging.error(f"❌ Order {order_id} failed after {order.retry_count} retries")
+                        logger.error("❌ Order %s failed after %d retries", order_id, order.retry_count)
                         order.mark_failed(f"Max retries exceeded: {str(e)}")
-                        await self._complete_order(order_id, order)
+                        await self._complete_order(order)
+                elif broker_order and not order.is_complete:
+                    self._retry_at.pop(client_id, None)
+                    await self._process_order_update(order, broker_order)
         
         except Exception as e:
-            logging.error(f"Error in order monitoring: {e}")
+            logger.error("Error in order monitoring: %s", e)
+    
+    @staticmethod
+    def _retry_delay(retry_count: int) -> float:
+        """Exponential backoff capped at 30s, with jitter to spread retries"""
+        return min(30.0, 0.5 * 2 ** retry_count) * (0.5 + random.random())
+    
+    async def _fetch_order(self, order_id: str) -> Dict[str, Any]:
+        """Fetch one order, preferring the broker's single-order endpoint"""
+        get_order_direct = getattr(self.broker, 'get_order_direct', None)
+        if get_order_direct is not None:
+            try:
+                return await get_order_direct(order_id)
+            except NotImplementedError:
+                pass
+        return await self.broker.get_order(order_id)
+    
+    async def _on_push(self, update: Dict[str, Any]):
+        """Handle one pushed order event from the broker stream
+        
+        The echoed client_order_id resolves orders whose submission call has
+        not returned yet; the broker id covers brokers that do not echo it.
+        """
+        broker_order = update.get('order') or {}
+        order = self._resolve(broker_order.get('client_order_id'))
+        if order is None and broker_order.get('id') is not None:
+            order = self._resolve(str(broker_order['id']))
+        if order is not None and not order.is_complete:
+            await self._process_order_update(order, broker_order)
     
     async def _process_order_update(self, order: EnhancedOrder, broker_order: Dict):
         """Process order update from broker"""
         try:
+            changed = False
             broker_status = broker_order.get('status', '').lower()
             filled_qty = float(broker_order.get('filled_qty', 0))
             avg_price = broker_order.get('filled_avg_price')
+            # One clock read stamps both the fill and the status change
+            now = datetime.now()
             
             # Map broker status to our status
-            status_mapping = {
-                'new': OrderStatus.SUBMITTED,
-                'pending_new': OrderStatus.PENDING,
-                'accepted': OrderStatus.SUBMITTED,
-                'partially_filled': OrderStatus.PARTIALLY_FILLED,
-                'filled': OrderStatus.FILLED,
-                'done_for_day': OrderStatus.FILLED,
-                'canceled': OrderStatus.CANCELLED,
-                'cancelled': OrderStatus.CANCELLED,
-                'expired': OrderStatus.EXPIRED,
-                'replaced': OrderStatus.SUBMITTED,
-                'pending_cancel': OrderStatus.PENDING_CANCEL,
-                'pending_replace': OrderStatus.SUBMITTED,
-                'rejected': OrderStatus.REJECTED,
-                'suspended': OrderStatus.FAILED,
-                'stopped': OrderStatus.CANCELLED
-            }
-            
-            new_status = status_mapping.get(broker_status, OrderStatus.SUBMITTED)
+            new_status = _BROKER_STATUS.get(broker_status, OrderStatus.SUBMITTED)
             
             # Check for fills
             if filled_qty > order.filled_qty:
                 fill_qty = filled_qty - order.filled_qty
                 fill_price = float(avg_price) if avg_price else order.price or 0.0
                 
-                order.update_fill(fill_qty, fill_price)
-                logging.info(f"💰 Order {order.order_id} filled: {fill_qty} @ ${fill_price:.4f}")
+                order.update_fill(fill_qty, fill_price, now=now)
+                changed = True
+                logger.info("fill order_id=%s qty=%s price=%.4f", order.order_id, fill_qty, fill_price)
                 
                 # Update blotter
                 if self.order_blotter:
@@ -393,23 +669,29 @@ class OrderManager:
             # Update status
             if new_status != order.status:
                 order.status = new_status
-                order.updated_at = datetime.now()
+                order.updated_at = now
+                changed = True
                 
-                logging.info(f"📊 Order {order.order_id} status: {new_status.value}")
+                logger.info("status order_id=%s status=%s", order.order_id, new_status.value)
             
             # Check if order is complete
             if order.is_complete:
-                await self._complete_order(order.order_id, order)
+                await self._complete_order(order)
+            elif changed and self.order_journal:
+                self.order_journal.upsert(order)
                 
         except Exception as e:
-            logging.error(f"Error processing order update: {e}")
+            logger.error("Error processing order update: %s", e)
     
-    async def _complete_order(self, order_id: str, order: EnhancedOrder):
+    async def _complete_order(self, order: EnhancedOrder):
         """Complete order and run callbacks"""
+        client_id = order.client_order_id
         try:
             # Remove from active orders
-            if order_id in self.active_orders:
-                del self.active_orders[order_id]
+            if client_id in self.active_orders:
+                self._untrack(order)
+                if self.order_journal:
+                    self.order_journal.delete(client_id)
             
             # Add to completed orders
             self.completed_orders.append(order)
@@ -427,62 +709,72 @@ class OrderManager:
                     )
             
             # Run callbacks
-            if order_id in self.order_callbacks:
-                for callback in self.order_callbacks[order_id]:
+            if client_id in self.order_callbacks:
+                for callback in self.order_callbacks[client_id]:
                     try:
                         if asyncio.iscoroutinefunction(callback):
                             await callback(order)
                         else:
                             callback(order)
                     except Exception as e:
-                        logging.error(f"Error in order callback: {e}")
+                        logger.error("Error in order callback: %s", e)
                 
-                del self.order_callbacks[order_id]
+                del self.order_callbacks[client_id]
             
-            logging.info(f"✅ Order {order_id} completed: {order.status.value}")
+            logger.info("completed order_id=%s status=%s", order.order_id, order.status.value)
             
             # Stop monitoring if no active orders
             if not self.active_orders:
                 await self.stop_monitoring()
                 
         except Exception as e:
-            logging.error(f"Error completing order {order_id}: {e}")
+            logger.error("Error completing order %s: %s", client_id, e)
     
     async def cancel_order(self, order_id: str) -> bool:
-        """Cancel an active order"""
+        """Cancel an active order by client_order_id or broker order id"""
         try:
-            if order_id not in self.active_orders:
-                logging.warning(f"Order {order_id} not found in active orders")
+            order = self._resolve(order_id)
+            if order is None:
+                logger.warning("Order %s not found in active orders", order_id)
                 return False
             
-            order = self.active_orders[order_id]
             if order.is_complete:
-                logging.warning(f"Order {order_id} is already complete")
+                logger.warning("Order %s is already complete", order_id)
+                return False
+            if order.order_id is None:
+                logger.warning("Order %s has not been accepted by the broker yet", order_id)
                 return False
             
             # Cancel with broker
-            success = await self.broker.cancel_order(order_id)
+            success = await self.broker.cancel_order(order.order_id)
             
             if success:
                 order.status = OrderStatus.PENDING_CANCEL
                 order.updated_at = datetime.now()
-                logging.info(f"🚫 Order {order_id} cancellation requested")
+                if self.order_journal:
+                    self.order_journal.upsert(order)
+                logger.info("🚫 Order %s cancellation requested", order_id)
                 return True
             else:
-                logging.error(f"❌ Failed to cancel order {order_id}")
+                logger.error("❌ Failed to cancel order %s", order_id)
                 return False
                 
         except Exception as e:
-            logging.error(f"Error cancelling order {order_id}: {e}")
+            logger.error("Error cancelling order %s: %s", order_id, e)
             return False
     
-    def get_active_orders(self) -> Dict[str, EnhancedOrder]:
-        """Get all active orders"""
-        return self.active_orders.copy()
+    def get_active_orders(self) -> Mapping[str, EnhancedOrder]:
+        """Get all active orders, keyed by client_order_id
+        
+        Returns a live read-only view rather than a copy: it reflects later
+        submissions and completions, and must not be mutated.  Take
+        ``dict(...)`` of it to keep a snapshot.
+        """
+        return MappingProxyType(self.active_orders)
     
     def get_order_by_symbol(self, symbol: str) -> List[EnhancedOrder]:
         """Get all orders for a symbol"""
-        return [order for order in self.active_orders.values() if order.symbol == symbol]
+        return [self.active_orders[client_id] for client_id in self._by_symbol.get(symbol, ())]
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get order management metrics"""
@@ -503,16 +795,38 @@ class OrderManager:
             'monitoring_active': self.monitoring_active
         }
     
+    @staticmethod
+    def _write_recovery_file(filename: str, payload: bytes) -> None:
+        """Atomically replace ``filename`` with ``payload``"""
+        tmp = filename + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, filename)
+    
     async def cleanup(self):
         """Cleanup resources"""
         await self.stop_monitoring()
+        if self.stream_task:
+            self.stream_task.cancel()
+            try:
+                await self.stream_task
+            except asyncio.CancelledError:
+                pass
+            self.stream_task = None
         
-        # Save pending orders to file for recovery
-        if self.active_orders:
-            pending_orders = [order.to_dict() for order in self.active_orders.values()]
+        # Save pending orders to file for recovery; a journal already holds them
+        if self.active_orders and not self.order_journal:
+            pending_orders = list(self.active_orders.values())
             try:
-                with open('pending_orders.json', 'w') as f:
-                    json.dump(pending_orders, f, indent=2)
-                logging.info(f"💾 Saved {len(pending_orders)} pending orders for recovery")
+                payload = json_dumps([order.to_dict() for order in pending_orders])
+                # Written off the event loop, via a temp file so it is never truncated
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._write_recovery_file, 'pending_orders.json', payload
+                )
+                logger.info("💾 Saved %d pending orders for recovery", len(pending_orders))
             except Exception as e:
-                logging.error(f"Error saving pending orders: {e}")
+                logger.error("Error saving pending orders: %s", e)
+        
+        # Journaled orders stay on disk for the next run to recover
+        if self._owns_journal:
+            self.order_journal.close()
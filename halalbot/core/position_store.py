@@ -5,6 +5,13 @@ and can reload them on startup.  Each position entry contains the symbol,
 side, quantity, entry price, stop loss, target price and a user provided tag
 identifying the strategy that opened the trade.
 
+Saves are written to a temporary file and renamed over the original, so a
+crash mid-write never leaves a truncated file.  When changes happen on a
+running event loop they are coalesced: the file is rewritten at most once
+per ``save_delay`` seconds, and the write itself runs on a dedicated worker
+thread so disk I/O never blocks the loop.  Call :meth:`PositionStore.flush`
+on shutdown to write any change still pending and wait for it to land.
+
 This class is intentionally simple: it does not handle concurrent writes or
 sophisticated auditing.  For production usage you may want to replace it with
 a database-backed implementation (e.g. SQLite or Redis).
@@ -12,34 +19,77 @@ a database-backed implementation (e.g. SQLite or Redis).
 
 from __future__ import annotations
 
-import json
+import asyncio
 import os
-from typing import Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional
+
+from ._json import dumps as _dumps, loads as _loads
 
 
 class PositionStore:
     """Persist open positions to a JSON file and reload them at runtime."""
 
-    def __init__(self, filename: str = "positions.json") -> None:
+    def __init__(self, filename: str = "positions.json", save_delay: float = 0.2) -> None:
         self.filename = filename
+        self.save_delay = save_delay
         self.positions: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        # One worker keeps writes in order, so an older snapshot never lands last
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="position-store")
+        self._last_write: Optional[Future] = None
         self._load()
 
     def _load(self) -> None:
         """Load positions from disk if the file exists."""
         if os.path.exists(self.filename):
             try:
-                with open(self.filename, "r", encoding="utf-8") as f:
-                    self.positions = json.load(f)
+                with open(self.filename, "rb") as f:
+                    self.positions = _loads(f.read())
             except Exception:
                 # If the file is corrupted or unreadable start fresh
                 self.positions = {}
 
     def _save(self) -> None:
-        """Save the current positions to disk."""
+        """Schedule a save, coalescing bursts of changes on the event loop."""
+        self._dirty = True
+        if self._save_handle is not None:
+            return
         try:
-            with open(self.filename, "w", encoding="utf-8") as f:
-                json.dump(self.positions, f, indent=2)
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. scripts and backtests): write straight away
+            self.flush()
+            return
+        self._save_handle = loop.call_later(self.save_delay, self._write_behind)
+
+    def _write_behind(self) -> None:
+        """Hand a snapshot of the positions to the worker thread."""
+        self._save_handle = None
+        if self._dirty:
+            # Serialise on the caller's thread so the worker never sees a
+            # dict that is being modified.  The flag is cleared only once that
+            # succeeded, so a failed encode is retried by the next save.
+            payload = _dumps(self.positions)
+            self._dirty = False
+            self._last_write = self._executor.submit(self._write, payload)
+
+    def flush(self) -> None:
+        """Write pending changes to disk atomically and wait until they land."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+        self._write_behind()
+        if self._last_write is not None:
+            self._last_write.result()
+
+    def _write(self, payload: bytes) -> None:
+        """Replace the positions file with ``payload``."""
+        tmp = self.filename + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, self.filename)
         except Exception:
             # errors are intentionally swallowed to avoid bringing down the bot
             pass
@@ -72,6 +122,10 @@ class PositionStore:
             del self.positions[symbol]
             self._save()
 
+    def is_open(self, symbol: str) -> bool:
+        """Return ``True`` if a position in ``symbol`` is currently open."""
+        return symbol in self.positions
+
     def get_open_positions(self) -> Dict[str, Dict[str, Any]]:
         """Return a dictionary of all currently open positions."""
         return self.positions
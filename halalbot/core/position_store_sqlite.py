@@ -11,14 +11,36 @@ overwrite the previous entry.
 from __future__ import annotations
 
 import sqlite3
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Tuple
 
 
 class SQLitePositionStore:
     """Persist open positions in a SQLite database."""
 
+    # Statement text is kept identical across calls so sqlite3's prepared
+    # statement cache is reused for every write
+    _UPSERT_SQL = """
+        INSERT INTO positions (symbol, side, qty, entry_price, stop, target, strategy_tag)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(symbol) DO UPDATE SET
+            side=excluded.side,
+            qty=excluded.qty,
+            entry_price=excluded.entry_price,
+            stop=excluded.stop,
+            target=excluded.target,
+            strategy_tag=excluded.strategy_tag
+    """
+    _DELETE_SQL = "DELETE FROM positions WHERE symbol = ?"
+    _IS_OPEN_SQL = "SELECT 1 FROM positions WHERE symbol = ? LIMIT 1"
+    # symbol must stay the first column: it keys the result of get_open_positions
+    _SELECT_SQL = "SELECT symbol, side, qty, entry_price, stop, target, strategy_tag FROM positions"
+
     def __init__(self, filename: str = "positions.db") -> None:
         self.conn = sqlite3.connect(filename)
+        # WAL with synchronous=NORMAL avoids an fsync on every commit and lets
+        # readers proceed while a write is in progress
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         self.conn.execute(
             """
             CREATE TABLE IF NOT EXISTS positions (
@@ -45,41 +67,37 @@ class SQLitePositionStore:
         tag: str,
     ) -> None:
         """Insert or replace a position in the database."""
-        self.conn.execute(
-            """
-            INSERT INTO positions (symbol, side, qty, entry_price, stop, target, strategy_tag)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(symbol) DO UPDATE SET
-                side=excluded.side,
-                qty=excluded.qty,
-                entry_price=excluded.entry_price,
-                stop=excluded.stop,
-                target=excluded.target,
-                strategy_tag=excluded.strategy_tag
-            """,
-            (symbol, side, qty, entry_price, stop, target, tag),
-        )
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(self._UPSERT_SQL, (symbol, side, qty, entry_price, stop, target, tag))
+
+    def add_positions(
+        self, positions: Iterable[Tuple[str, str, float, float, float, float, str]]
+    ) -> None:
+        """Insert or replace many ``(symbol, side, qty, entry_price, stop, target, tag)``
+        rows in one transaction."""
+        with self.conn:
+            self.conn.executemany(self._UPSERT_SQL, positions)
 
     def close_position(self, symbol: str) -> None:
         """Delete a position from the database."""
-        self.conn.execute("DELETE FROM positions WHERE symbol = ?", (symbol,))
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(self._DELETE_SQL, (symbol,))
+
+    def flush(self) -> None:
+        """No-op kept for interface parity: every write commits immediately."""
+
+    def is_open(self, symbol: str) -> bool:
+        """Return ``True`` if a position in ``symbol`` is currently open.
+
+        This is a single primary-key lookup, so callers that only need
+        membership avoid materialising every row via ``get_open_positions``.
+        """
+        cur = self.conn.execute(self._IS_OPEN_SQL, (symbol,))
+        return cur.fetchone() is not None
 
     def get_open_positions(self) -> Dict[str, Dict[str, Any]]:
         """Return all open positions as a dict keyed by symbol."""
-        cur = self.conn.execute("SELECT symbol, side, qty, entry_price, stop, target, strategy_tag FROM positions")
-        rows = cur.fetchall()
-        positions: Dict[str, Dict[str, Any]] = {}
-        for row in rows:
-            symbol, side, qty, entry_price, stop, target, tag = row
-            positions[symbol] = {
-                "symbol": symbol,
-                "side": side,
-                "qty": qty,
-                "entry_price": entry_price,
-                "stop": stop,
-                "target": target,
-                "strategy_tag": tag,
-            }
-        return positions
+        cur = self.conn.execute(self._SELECT_SQL)
+        # Column names are read once per query, not once per row
+        columns = [d[0] for d in cur.description]
+        return {row[0]: dict(zip(columns, row)) for row in cur}
@@ -11,6 +11,11 @@ from __future__ import annotations
 
 from typing import Dict, Optional
 
+import numpy as np
+
+# qty and entry price per position, filled in one pass by ``np.fromiter``
+_POSITION_DTYPE = np.dtype([("qty", np.float64), ("price", np.float64)])
+
 
 class RiskManager:
     """Calculate position sizes and portfolio risk metrics."""
@@ -48,6 +53,34 @@ class RiskManager:
         max_size = (account_value * self.max_position_pct) / current_price
         return min(raw_size, max_size)
 
+    def calculate_position_sizes(
+        self,
+        account_value: float,
+        prices: np.ndarray,
+        stops: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Vectorised :meth:`calculate_position_size` over many symbols.
+
+        ``stops`` entries that are not positive (use ``0`` or ``NaN`` for "no
+        stop") fall back to the full price as the per-share risk, as a
+        ``None`` stop does for a single symbol.  Symbols that cannot be
+        sized get ``0``.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        if account_value <= 0:
+            return np.zeros_like(prices)
+        if stops is None:
+            per_share_risk = prices
+        else:
+            stops = np.asarray(stops, dtype=np.float64)
+            per_share_risk = np.where(stops > 0, np.abs(prices - stops), prices)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            raw_size = (account_value * self.max_position_risk) / per_share_risk
+            # Never allow a position greater than max_position_pct of the account
+            max_size = (account_value * self.max_position_pct) / prices
+            sizes = np.minimum(raw_size, max_size)
+        return np.where((prices > 0) & (per_share_risk > 0), sizes, 0.0)
+
     def calculate_portfolio_risk(self, positions: Dict[str, Dict]) -> Dict[str, float]:
         """Aggregate simple risk metrics across current positions."""
         if not positions:
@@ -57,21 +90,18 @@ class RiskManager:
                 "concentration_risk": 0.0,
                 "number_of_positions": 0,
             }
-        total_value = 0.0
-        total_risk = 0.0
-        weights = {}
-        for sym, pos in positions.items():
-            value = pos.get("qty", 0) * pos.get("entry_price", 0)
-            total_value += value
-            total_risk += value * self.max_position_risk
-            weights[sym] = value
-        # Normalize weights and compute concentration risk
-        for sym in weights:
-            weights[sym] /= total_value
-        concentration_risk = sum(w ** 2 for w in weights.values())
+        arr = np.fromiter(
+            ((pos.get("qty", 0), pos.get("entry_price", 0)) for pos in positions.values()),
+            dtype=_POSITION_DTYPE,
+            count=len(positions),
+        )
+        values = arr["qty"] * arr["price"]
+        total_value = float(values.sum())
+        # Herfindahl index of position weights
+        concentration_risk = float(((values / total_value) ** 2).sum()) if total_value else 0.0
         return {
             "portfolio_value": total_value,
-            "risk_at_risk": total_risk,
+            "risk_at_risk": total_value * self.max_position_risk,
             "concentration_risk": concentration_risk,
             "number_of_positions": len(positions),
         }
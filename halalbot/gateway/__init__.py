@@ -1,13 +1,9 @@
 """
-Screening utilities for assessing halal compliance.
+Broker gateways for order routing.
 
-This package contains abstractions for retrieving financial statements and
-classifying them according to Islamic finance principles.  Use
-``data_gateway`` to fetch fundamental data from external providers and
-``halal_rules`` to load lists of halal approved crypto assets and
-prohibited features from configuration.
+``broker_gateway`` holds the canonical ``AlpacaBrokerGateway``, a thin
+asynchronous wrapper around Alpaca's trading REST API.  The full-featured
+``EnhancedAlpacaBrokerGateway`` lives in :mod:`halalbot.broker_gateway`.
 """
 
-from .data_gateway import DataGateway, FMPGateway  # noqa: F401
-from .halal_rules import load_rules  # noqa: F401
-from .advanced_screener import AdvancedHalalScreener  # noqa: F401
\ No newline at end of file
+from .broker_gateway import AlpacaBrokerGateway  # noqa: F401
@@ -20,10 +20,22 @@ Example
 from __future__ import annotations
 
 import os
-from typing import Optional
+from typing import Any, Optional
 
 import aiohttp
 
+try:  # orjson is optional; it encodes and decodes JSON several times faster
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # pragma: no cover - fall back to the standard library
+    from json import dumps as _std_dumps, loads as json_loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON like ``orjson.dumps``."""
+        return _std_dumps(obj, separators=(",", ":")).encode()
+
+# Request bodies are pre-encoded, so the content type is set explicitly
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class AlpacaBrokerGateway:
     """Asynchronous broker gateway for Alpaca paper trading."""
@@ -35,17 +47,44 @@ class AlpacaBrokerGateway:
         self.api_secret = api_secret or os.getenv("ALPACA_SECRET_KEY")
         if not self.api_key or not self.api_secret:
             raise ValueError("Alpaca API credentials are required")
+        # One pooled session per gateway so keep-alive connections are reused
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={
+                    "APCA-API-KEY-ID": self.api_key,
+                    "APCA-API-SECRET-KEY": self.api_secret,
+                },
+                timeout=aiohttp.ClientTimeout(total=15, connect=3, sock_connect=3, sock_read=10),
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75),
+            )
+        return self._session
 
     async def _request(self, method: str, path: str, json: Optional[dict] = None) -> dict:
-        headers = {
-            "APCA-API-KEY-ID": self.api_key,
-            "APCA-API-SECRET-KEY": self.api_secret,
-        }
         url = f"{self.BASE_URL}{path}"
-        async with aiohttp.ClientSession() as session:
-            async with session.request(method, url, headers=headers, json=json, timeout=15) as resp:
-                resp.raise_for_status()
-                return await resp.json()
+        session = await self._get_session()
+        # Bodies are encoded with json_dumps rather than aiohttp's json= path
+        body = json_dumps(json) if json is not None else None
+        headers = JSON_HEADERS if body is not None else None
+        async with session.request(method, url, data=body, headers=headers) as resp:
+            resp.raise_for_status()
+            return json_loads(await resp.read())
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AlpacaBrokerGateway":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
 
     async def get_account_value(self) -> float:
         """Return the current equity in the Alpaca account."""
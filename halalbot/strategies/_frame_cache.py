@@ -0,0 +1,42 @@
+"""
+Bookkeeping for the per-frame arrays that strategies cache in ``prepare``.
+
+A backtest calls ``generate_signal`` once per bar on the same frame, so the
+strategies compute every bar in one vectorised pass and read from the result.
+The live engine instead builds a fresh frame per tick and only asks about its
+last bar; those calls compute just that bar and leave the cache alone.
+
+:class:`FrameCache` remembers which frame the cached arrays belong to through
+a weak reference, so an old frame is never kept alive by the strategy, and
+also records its length and last index label so rows appended in place are
+noticed.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any, Optional, Tuple
+
+import pandas as pd
+
+
+def _frame_key(data: pd.DataFrame) -> Tuple[int, Any]:
+    """Return the length and last index label of ``data``."""
+    return len(data), data.index[-1] if len(data) else None
+
+
+class FrameCache:
+    """Track the frame that a strategy's cached arrays were computed from."""
+
+    def __init__(self) -> None:
+        self._ref: Optional[weakref.ref] = None
+        self._key: Optional[Tuple[int, Any]] = None
+
+    def matches(self, data: pd.DataFrame) -> bool:
+        """Return ``True`` if the cache was filled from ``data`` as it is now."""
+        return self._ref is not None and self._ref() is data and self._key == _frame_key(data)
+
+    def remember(self, data: pd.DataFrame) -> None:
+        """Record that the cache now holds arrays computed from ``data``."""
+        self._ref = weakref.ref(data)
+        self._key = _frame_key(data)
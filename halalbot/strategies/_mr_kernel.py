@@ -0,0 +1,121 @@
+"""
+Signal kernel for ``MeanReversionStrategy``.
+
+The rolling z-score and the entry/exit state machine are written against
+plain arrays and scalars so they compile to native code with Numba when that
+package is installed.  Numba is optional: without it the same functions run
+as ordinary Python over lists through the fallback in ``halalbot._jit``,
+like the backtest kernels in ``halalbot.backtest._sim``.
+
+The z-score of bar ``i`` compares its close with the mean and sample
+standard deviation of the ``lookback`` closes before it.  Both are updated
+in O(1) per bar with Welford's method, which stays accurate where a running
+sum of squares would cancel catastrophically.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+from .._jit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def _rolling_zscore(close, lookback):
+    n = len(close)
+    z = np.full(n, np.nan)
+    if lookback < 2 or n <= lookback:
+        return z
+    # Welford mean and sum of squared deviations of the first window
+    mean = 0.0
+    m2 = 0.0
+    same = 0  # length of the run of equal closes ending the window
+    for j in range(lookback):
+        x = close[j]
+        same = same + 1 if j > 0 and x == close[j - 1] else 1
+        delta = x - mean
+        mean += delta / (j + 1)
+        m2 += delta * (x - mean)
+    for i in range(lookback, n):
+        if i > lookback:
+            # Slide the window: the newest close replaces the oldest
+            x_new = close[i - 1]
+            x_old = close[i - 1 - lookback]
+            same = same + 1 if x_new == close[i - 2] else 1
+            delta = x_new - x_old
+            new_mean = mean + delta / lookback
+            m2 += delta * (x_new - new_mean + x_old - mean)
+            mean = new_mean
+        # A window of identical closes has exactly zero variance; rounding in
+        # the running update must not turn it into a huge z-score
+        if same >= lookback or m2 <= 0:
+            continue
+        z[i] = (close[i] - mean) / math.sqrt(m2 / (lookback - 1))
+    return z
+
+
+@njit(cache=True)
+def _run_mr(close, lookback, entry_z, exit_z, position):
+    z = _rolling_zscore(close, lookback)
+    n = len(z)
+    signals = np.zeros(n, dtype=np.int8)
+    for i in range(n):
+        z_score = z[i]
+        if math.isnan(z_score):
+            continue
+        if position == 0:
+            if z_score > entry_z:
+                position = -1
+                signals[i] = -1
+            elif z_score < -entry_z:
+                position = 1
+                signals[i] = 1
+        elif abs(z_score) < exit_z:
+            signals[i] = -1 if position > 0 else 1
+            position = 0
+    return signals, position
+
+
+def rolling_zscore(close: np.ndarray, lookback: int) -> np.ndarray:
+    """Return the z-score of every bar, NaN where it is undefined.
+
+    That is the first ``lookback`` bars and any bar whose window has zero
+    variance.
+    """
+    if NUMBA_AVAILABLE:
+        return _rolling_zscore(close, int(lookback))
+    return _rolling_zscore(close.tolist(), lookback)
+
+
+def run_mr(
+    close: np.ndarray,
+    lookback: int,
+    entry_z: float,
+    exit_z: float,
+    position: int = 0,
+) -> Tuple[np.ndarray, int]:
+    """Run the mean reversion state machine over every bar.
+
+    Parameters
+    ----------
+    close:
+        Close prices as a float64 array.
+    lookback, entry_z, exit_z:
+        The strategy parameters.
+    position:
+        Position held before the first bar: ``1`` long, ``-1`` short, ``0`` flat.
+
+    Returns
+    -------
+    Tuple[np.ndarray, int]
+        The int8 signal codes (``1`` buy, ``-1`` sell, ``0`` hold) and the
+        position held after the last bar.
+    """
+    if NUMBA_AVAILABLE:
+        signals, position = _run_mr(close, int(lookback), float(entry_z), float(exit_z), int(position))
+    else:
+        signals, position = _run_mr(close.tolist(), lookback, entry_z, exit_z, position)
+    return signals, int(position)
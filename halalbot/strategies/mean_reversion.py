@@ -10,8 +10,14 @@ standard deviations of the past price series.
 
 from __future__ import annotations
 
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
+from ._frame_cache import FrameCache
+from ._mr_kernel import rolling_zscore, run_mr
+
 
 class MeanReversionStrategy:
     """Mean reversion strategy using z‑score thresholds."""
@@ -23,18 +29,33 @@ class MeanReversionStrategy:
         self.entry_z = entry_z
         self.exit_z = exit_z
         self.position = 0  # internal state: -1 for short, 1 for long
+        # Per-bar z-scores cached by ``prepare`` for the frame they came from
+        self._prepared = FrameCache()
+        self._z: Optional[np.ndarray] = None
+
+    def prepare(self, data: pd.DataFrame) -> None:
+        """Compute the z‑score of every bar of ``data`` in one compiled pass.
+
+        ``generate_signal`` prepares frames itself when it is asked about any
+        bar but the last one.
+        """
+        self._z = rolling_zscore(data["close"].to_numpy(dtype=np.float64), self.lookback)
+        self._prepared.remember(data)
 
     def generate_signal(self, data: pd.DataFrame, index: int) -> str:
         """Generate a trading signal based on z‑score of price deviation."""
         if index < self.lookback:
             return "hold"
-        window = data["close"].iloc[index - self.lookback : index]
-        mean = window.mean()
-        std = window.std()
-        if std == 0:
+        if self._prepared.matches(data):
+            z_score = self._z[index]
+        elif index == len(data) - 1:
+            # Live tick on a fresh frame: only the latest bar is needed
+            z_score = self._latest_zscore(data["close"].to_numpy(dtype=np.float64), index)
+        else:
+            self.prepare(data)
+            z_score = self._z[index]
+        if np.isnan(z_score):
             return "hold"
-        price = data["close"].iloc[index]
-        z_score = (price - mean) / std
         # Entry conditions
         if self.position == 0:
             if z_score > self.entry_z:
@@ -50,3 +71,26 @@ class MeanReversionStrategy:
                 self.position = 0
                 return sig
         return "hold"
+
+    def _latest_zscore(self, close: np.ndarray, index: int) -> float:
+        """Return the z‑score of bar ``index`` alone, NaN if the window is flat."""
+        window = close[index - self.lookback : index]
+        std = window.std(ddof=1) if len(window) > 1 else 0.0
+        if not std > 0:
+            return np.nan
+        return (close[index] - window.mean()) / std
+
+    def generate_signals(self, data: pd.DataFrame) -> np.ndarray:
+        """Return the signal code of every bar (``1`` buy, ``-1`` sell, ``0`` hold).
+
+        Equivalent to calling ``generate_signal`` on each bar in turn, and
+        likewise leaves ``position`` as it stands after the last bar.
+        """
+        signals, self.position = run_mr(
+            data["close"].to_numpy(dtype=np.float64),
+            self.lookback,
+            self.entry_z,
+            self.exit_z,
+            self.position,
+        )
+        return signals
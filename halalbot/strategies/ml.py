@@ -11,11 +11,15 @@ validation logic should be implemented outside of this class.
 
 from __future__ import annotations
 
+from typing import Optional
+
 import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator
 from sklearn.preprocessing import StandardScaler
 
+from ._frame_cache import FrameCache
+
 
 class MLStrategy:
     """Machine learning based strategy skeleton."""
@@ -24,20 +28,44 @@ class MLStrategy:
         self.model = model
         self.feature_window = feature_window
         self.scaler = StandardScaler()
+        # Rolling return statistics cached by ``prepare`` for one frame
+        self._prepared = FrameCache()
+        self._mean: Optional[np.ndarray] = None
+        self._std: Optional[np.ndarray] = None
+
+    def prepare(self, data: pd.DataFrame) -> None:
+        """Compute the features of every bar of ``data`` in one pass.
+
+        Returns are taken once for the whole series; entry ``i`` of the
+        rolling statistics covers up to ``feature_window - 1`` returns ending
+        at bar ``i``.  ``_extract_features`` prepares frames itself when it
+        is asked about any bar but the last one.
+        """
+        returns = data["close"].pct_change()
+        window = max(self.feature_window - 1, 1)
+        # min_periods=1 matches the shorter windows of the first few bars
+        rolling = returns.rolling(window, min_periods=1)
+        self._mean = rolling.mean().fillna(0.0).to_numpy(dtype=np.float64)
+        self._std = rolling.std(ddof=0).fillna(0.0).to_numpy(dtype=np.float64)
+        self._prepared.remember(data)
 
     def _extract_features(self, data: pd.DataFrame, index: int) -> np.ndarray:
         """Extract feature vector from the past ``feature_window`` bars."""
-        start = max(0, index - self.feature_window)
-        window = data.iloc[start:index]
-        # Simple features: returns and rolling statistics
-        returns = window["close"].pct_change().dropna().values
-        features = []
-        if len(returns) > 0:
-            features.append(np.mean(returns))
-            features.append(np.std(returns))
-        else:
-            features.extend([0.0, 0.0])
-        return np.array(features).reshape(1, -1)
+        # Simple features: mean and standard deviation of the window's returns
+        if index < 1 or self.feature_window < 2:
+            return np.zeros((1, 2))
+        if self._prepared.matches(data):
+            return np.array([[self._mean[index - 1], self._std[index - 1]]])
+        if index == len(data) - 1:
+            # Live tick on a fresh frame: only the latest window is needed
+            close = data["close"].to_numpy(dtype=np.float64)
+            window = close[max(0, index - self.feature_window) : index]
+            returns = window[1:] / window[:-1] - 1
+            if len(returns) == 0:
+                return np.zeros((1, 2))
+            return np.array([[returns.mean(), returns.std()]])
+        self.prepare(data)
+        return np.array([[self._mean[index - 1], self._std[index - 1]]])
 
     def generate_signal(self, data: pd.DataFrame, index: int) -> str:
         """Generate a signal using the trained model."""
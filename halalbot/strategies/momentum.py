@@ -10,14 +10,36 @@ over the closing prices in the supplied data.
 
 from __future__ import annotations
 
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
+from ._frame_cache import FrameCache
+
 
 class MomentumStrategy:
     """Momentum trading strategy using a simple moving average crossover."""
 
     def __init__(self, lookback: int = 20) -> None:
         self.lookback = lookback
+        # Per-bar arrays cached by ``prepare`` for the frame they came from
+        self._prepared = FrameCache()
+        self._close: Optional[np.ndarray] = None
+        self._ma: Optional[np.ndarray] = None
+
+    def prepare(self, data: pd.DataFrame) -> None:
+        """Compute the moving average for every bar of ``data`` in one pass.
+
+        The average at bar ``i`` covers the ``lookback`` closes before it, so
+        it is undefined (NaN) for the first ``lookback`` bars.
+        ``generate_signal`` prepares frames itself when it is asked about any
+        bar but the last one.
+        """
+        close = data["close"]
+        self._close = close.to_numpy(dtype=np.float64)
+        self._ma = close.rolling(self.lookback).mean().shift(1).to_numpy(dtype=np.float64)
+        self._prepared.remember(data)
 
     def generate_signal(self, data: pd.DataFrame, index: int) -> str:
         """Generate trading signal for a given row of data.
@@ -36,13 +58,27 @@ class MomentumStrategy:
         """
         if index < self.lookback:
             return "hold"
-        window = data["close"].iloc[index - self.lookback : index]
-        if len(window) < self.lookback:
-            return "hold"
-        ma = window.mean()
-        price = data["close"].iloc[index]
+        if self._prepared.matches(data):
+            price = self._close[index]
+            ma = self._ma[index]
+        elif index == len(data) - 1:
+            # Live tick on a fresh frame: only the latest bar is needed
+            close = data["close"].to_numpy(dtype=np.float64)
+            price = close[index]
+            ma = close[index - self.lookback : index].mean()
+        else:
+            self.prepare(data)
+            price = self._close[index]
+            ma = self._ma[index]
         if price > ma:
             return "buy"
         elif price < ma:
             return "sell"
         return "hold"
+
+    def generate_signals(self, data: pd.DataFrame) -> np.ndarray:
+        """Return the signal code of every bar (``1`` buy, ``-1`` sell, ``0`` hold)."""
+        self.prepare(data)
+        close, ma = self._close, self._ma
+        # Comparisons against the NaN warm-up bars are False, so those hold
+        return np.where(close > ma, 1, np.where(close < ma, -1, 0)).astype(np.int8)
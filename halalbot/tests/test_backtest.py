@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 import pytest
+from halalbot.backtest._sim import max_drawdown, return_stats
 from halalbot.backtest.engine import BacktestEngine
 
 
@@ -17,3 +19,81 @@ def test_backtest_buy_and_hold():
     results = engine.run_backtest(df, DummyStrategy())
     # Should buy 100 shares at 10 and finish with 100 * 14 = 1400
     assert results["final_equity"] == pytest.approx(1400)
+
+
+class AlternatingStrategy:
+    """Buys on even bars and sells on odd bars, exposing both signal APIs."""
+
+    def generate_signal(self, data: pd.DataFrame, index: int) -> str:
+        return "buy" if index % 2 == 0 else "sell"
+
+
+class VectorAlternatingStrategy(AlternatingStrategy):
+    def generate_signals(self, data: pd.DataFrame):
+        return [1 if i % 2 == 0 else -1 for i in range(len(data))]
+
+
+def test_vectorized_signals_match_per_bar():
+    df = pd.DataFrame({"close": [10, 12, 11, 13, 12, 15]})
+    engine = BacktestEngine(initial_capital=1000, slippage_value=0.001, fee_per_trade=1.0)
+    per_bar = engine.run_backtest(df, AlternatingStrategy())
+    vectorized = engine.run_backtest(df, VectorAlternatingStrategy())
+    assert vectorized["total_trades"] == per_bar["total_trades"] == 6
+    assert vectorized["final_equity"] == pytest.approx(per_bar["final_equity"])
+    assert vectorized["equity_curve"] == pytest.approx(per_bar["equity_curve"])
+    assert vectorized["performance_metrics"] == pytest.approx(per_bar["performance_metrics"])
+
+
+def test_metric_kernels_match_numpy():
+    equity = np.array([100.0, 104.0, 98.0, 101.0, 95.0, 110.0, 107.0])
+    returns = np.diff(equity) / equity[:-1]
+    mean_ret, std_ret, std_down = return_stats(equity)
+    assert mean_ret == pytest.approx(np.mean(returns))
+    assert std_ret == pytest.approx(np.std(returns))
+    assert std_down == pytest.approx(np.std(returns[returns < 0]))
+    running_max = np.maximum.accumulate(equity)
+    assert max_drawdown(equity) == pytest.approx(abs(np.min((equity - running_max) / running_max)))
+
+
+def test_log_return_stats():
+    equity = np.array([100.0, 104.0, 98.0, 101.0, 95.0, 110.0, 107.0])
+    log_returns = np.diff(np.log(equity))
+    mean_ret, std_ret, std_down = return_stats(equity, log_returns=True)
+    assert mean_ret == pytest.approx(np.mean(log_returns))
+    assert std_ret == pytest.approx(np.std(log_returns))
+    assert std_down == pytest.approx(np.std(log_returns[log_returns < 0]))
+
+
+class FlakyStrategy:
+    """Raises on selected bars; those bars must be treated as holds."""
+
+    def generate_signal(self, data: pd.DataFrame, index: int) -> str:
+        if index in (0, 3):
+            raise RuntimeError("indicator not ready")
+        return "buy" if index == 1 else "sell" if index == 4 else "hold"
+
+
+def test_strategy_errors_become_holds():
+    df = pd.DataFrame({"close": [10, 10, 11, 12, 13, 14]})
+    engine = BacktestEngine(initial_capital=1000, slippage_value=0)
+    results = engine.run_backtest(df, FlakyStrategy())
+    assert [t["action"] for t in results["trades"]] == ["buy", "sell"]
+    assert results["final_equity"] == pytest.approx(1300)
+
+
+def test_fast_path_matches_dataframe_backtest():
+    close = [10.0, 12.0, 11.0, 13.0, 12.0, 15.0]
+    index = pd.date_range("2024-01-01", periods=len(close), freq="D")
+    df = pd.DataFrame(
+        {"open": close, "high": close, "low": close, "close": close, "volume": 1.0},
+        index=index,
+    )
+    engine = BacktestEngine(initial_capital=1000, slippage_value=0.001, fee_per_trade=1.0)
+    strategy = AlternatingStrategy()
+    expected = engine.run_backtest(df, strategy)
+    signals = engine.collect_signals(df, strategy)
+    ohlcv = df[["open", "high", "low", "close", "volume"]].to_numpy()
+    fast = engine.run_backtest_fast(ohlcv, index.to_numpy(), signals)
+    assert fast["equity_curve"] == pytest.approx(expected["equity_curve"])
+    assert [t["timestamp"] for t in fast["trades"]] == [t["timestamp"] for t in expected["trades"]]
+    assert isinstance(fast["trades"][0]["timestamp"], pd.Timestamp)
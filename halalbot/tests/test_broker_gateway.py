@@ -0,0 +1,86 @@
+import asyncio
+
+from halalbot.broker_gateway import EnhancedAlpacaBrokerGateway, MockBrokerGateway
+
+
+def test_mock_batch_returns_responses_in_order():
+    async def run():
+        broker = MockBrokerGateway()
+        responses = await broker.place_orders_batch([
+            {"symbol": "AAPL", "side": "buy", "qty": 2},
+            {"symbol": "MSFT", "side": "buy", "qty": 1},
+            {"symbol": "AAPL", "side": "sell", "qty": 1},
+        ])
+        assert [r["symbol"] for r in responses] == ["AAPL", "MSFT", "AAPL"]
+        assert broker.positions == {"AAPL": 1.0, "MSFT": 1.0}
+
+    asyncio.run(run())
+
+
+def test_get_order_uses_single_order_endpoint():
+    broker = EnhancedAlpacaBrokerGateway("key", "secret")
+    requests = []
+
+    async def fake_request(method, path, params=None, json=None):
+        requests.append((method, path))
+        return {"id": "abc", "status": "new"}
+
+    broker._request = fake_request
+    assert asyncio.run(broker.get_order("abc")) == {"id": "abc", "status": "new"}
+    assert requests == [("GET", "/v2/orders/abc")]
+
+
+def test_reconcile_positions_reports_discrepancies():
+    broker = EnhancedAlpacaBrokerGateway("key", "secret")
+
+    async def positions():
+        return [{"symbol": "AAPL", "qty": "10"}, {"symbol": "TSLA", "qty": "3"}]
+
+    broker.get_positions = positions
+    result = asyncio.run(broker.reconcile_positions({"AAPL": 10.0, "MSFT": 5.0}))
+    assert not result["reconciled"]
+    assert result["discrepancies"] == {
+        "MSFT": {"expected": 5.0, "actual": 0.0, "difference": -5.0},
+        "TSLA": {"expected": 0.0, "actual": 3.0, "difference": 3.0, "unexpected": True},
+    }
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return self.body
+
+
+class _FakeSession:
+    closed = False
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def get(self, url, params=None):
+        return _FakeResponse(self.body)
+
+
+def test_get_bars_np_skips_unrequested_symbols(monkeypatch):
+    import halalbot.broker_gateway as gateway
+
+    # Exercise the whole-body parser regardless of whether ijson is installed
+    monkeypatch.setattr(gateway, "ijson", None)
+    bar = '{"t": "2024-01-02T00:00:00Z", "o": 1, "h": 2, "l": 0.5, "c": 1.5, "v": 100}'
+    body = ('{"bars": {"AAPL": [%s], "aapl": [%s], "MSFT": [%s]}}' % (bar, bar, bar)).encode()
+    broker = EnhancedAlpacaBrokerGateway("key", "secret")
+    broker.session = _FakeSession(body)
+    codes, times, ohlcv = asyncio.run(broker.get_bars_np(["AAPL", "MSFT"], limit=5))
+    assert codes.tolist() == [0, 1]
+    assert ohlcv[:, 3].tolist() == [1.5, 1.5]
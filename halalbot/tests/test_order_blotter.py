@@ -0,0 +1,37 @@
+import asyncio
+
+from halalbot.core.order_blotter import OrderBlotter
+
+
+def test_sync_and_async_writes_can_be_mixed(tmp_path):
+    async def run():
+        blotter = OrderBlotter(str(tmp_path / "orders.db"))
+
+        async def write_async():
+            for _ in range(200):
+                await blotter.add_order_async("AAPL", "buy", 1, 100.0)
+
+        writer = asyncio.create_task(write_async())
+        for _ in range(200):
+            blotter.add_order("MSFT", "sell", 1, 200.0)
+            assert all(o["status"] == "submitted" for o in blotter.list_orders().values())
+            await asyncio.sleep(0)
+        await writer
+
+        assert len(blotter.orders_by_symbol("AAPL")) == 200
+        assert len(blotter.orders_by_symbol("MSFT")) == 200
+        blotter.close()
+
+    asyncio.run(run())
+
+
+def test_writes_while_iterating(tmp_path):
+    blotter = OrderBlotter(str(tmp_path / "orders.db"))
+    blotter.add_orders_bulk([("AAPL", "buy", 1, 100.0, "submitted")] * 1000)
+    records = blotter.iter_orders()
+    order_id, order = next(records)
+    blotter.update_status(order_id, "filled")
+    assert order["status"] == "submitted"
+    assert len(list(records)) == 999
+    assert len(blotter.list_open_orders()) == 999
+    blotter.close()
@@ -0,0 +1,230 @@
+import asyncio
+
+import numpy as np
+
+from halalbot.broker_gateway import MockBrokerGateway
+from halalbot.core.order_journal import OrderJournal
+from halalbot.core.order_manager import EnhancedOrder, OrderManager, OrderStatus
+
+
+def test_journaled_orders_are_recovered_after_restart(tmp_path):
+    journal_file = str(tmp_path / "orders.db")
+
+    async def run():
+        broker = MockBrokerGateway()
+        manager = OrderManager(broker, journal_file=journal_file)
+        orders = [EnhancedOrder("AAPL", "buy", np.float64(5)), EnhancedOrder("MSFT", "buy", 2)]
+        assert await manager.submit_orders(orders) == [True, True]
+        # Simulate a crash: nothing is cleaned up and the manager is dropped
+        await manager.stop_monitoring()
+
+        restarted = OrderManager(broker, journal_file=journal_file)
+        recovered = restarted.get_active_orders()
+        assert set(recovered) == {o.client_order_id for o in orders}
+        assert recovered[orders[0].client_order_id].order_id == orders[0].order_id
+        assert recovered[orders[0].client_order_id].quantity == 5
+        assert restarted.monitoring_active
+
+        # The recovered orders are monitored and complete as usual
+        await restarted._check_order_updates()
+        assert not restarted.get_active_orders()
+        assert all(o.status == OrderStatus.FILLED for o in restarted.completed_orders)
+        await restarted.cleanup()
+        assert OrderJournal(journal_file).pending_orders() == []
+
+    asyncio.run(run())
+
+
+class FlakyBroker(MockBrokerGateway):
+    """Mock broker whose orders stay open and whose lookups can fail."""
+
+    def __init__(self):
+        super().__init__()
+        self.lookup_error = None
+        self.reject_symbols = set()
+
+    async def place_order(self, symbol, side, qty, **kwargs):
+        if symbol in self.reject_symbols:
+            return {"message": "insufficient buying power"}
+        order = await super().place_order(symbol, side, qty, **kwargs)
+        order.update(status="new", filled_qty="0")
+        return order
+
+    async def get_order(self, order_id):
+        if self.lookup_error is not None:
+            raise self.lookup_error
+        return await super().get_order(order_id)
+
+
+def test_submit_fill_and_complete():
+    async def run():
+        broker = FlakyBroker()
+        manager = OrderManager(broker, journal_file=None)
+        filled = []
+        order = EnhancedOrder("AAPL", "buy", 10)
+        assert await manager.submit_order(order, callback=filled.append)
+        assert order.status == OrderStatus.SUBMITTED
+        assert manager.get_order_by_symbol("AAPL") == [order]
+
+        # The broker fills the order; the next sweep completes it
+        broker.orders[order.order_id].update(status="filled", filled_qty="10")
+        await manager._check_order_updates()
+        assert order.status == OrderStatus.FILLED
+        assert order.avg_fill_price == 100.0
+        assert filled == [order]
+        assert not manager.get_active_orders()
+        assert manager.get_order_by_symbol("AAPL") == []
+        assert manager.get_metrics()["orders_filled"] == 1
+        await manager.cleanup()
+
+    asyncio.run(run())
+
+
+def test_batch_places_buys_first_and_rejects_in_place():
+    async def run():
+        broker = FlakyBroker()
+        broker.reject_symbols.add("TSLA")
+        manager = OrderManager(broker, journal_file=None)
+        orders = [
+            EnhancedOrder("MSFT", "sell", 1),
+            EnhancedOrder("TSLA", "buy", 1),
+            EnhancedOrder("AAPL", "buy", 1),
+        ]
+        assert await manager.submit_orders(orders) == [True, False, True]
+        # Buys were sent before the sell, so the mock ids follow that order
+        assert int(orders[2].order_id) < int(orders[0].order_id)
+        assert orders[1].status == OrderStatus.REJECTED
+        assert orders[1].last_error == "insufficient buying power"
+        assert set(manager.get_active_orders()) == {orders[0].client_order_id, orders[2].client_order_id}
+        assert manager.get_order_by_symbol("TSLA") == []
+        await manager.cleanup()
+
+    asyncio.run(run())
+
+
+def test_batch_exception_fails_every_order():
+    class DownBroker(FlakyBroker):
+        async def place_orders_batch(self, orders):
+            raise ConnectionError("broker unreachable")
+
+    async def run():
+        manager = OrderManager(DownBroker(), journal_file=None)
+        orders = [EnhancedOrder("AAPL", "buy", 1), EnhancedOrder("MSFT", "buy", 1)]
+        assert await manager.submit_orders(orders) == [False, False]
+        assert all(o.status == OrderStatus.FAILED for o in orders)
+        assert "broker unreachable" in orders[0].last_error
+        assert not manager.get_active_orders()
+        assert manager.get_metrics()["orders_failed"] == 2
+        await manager.cleanup()
+
+    asyncio.run(run())
+
+
+def test_failed_lookups_back_off_then_fail():
+    async def run():
+        broker = FlakyBroker()
+        manager = OrderManager(broker, journal_file=None)
+        order = EnhancedOrder("AAPL", "buy", 1, max_retries=3)
+        await manager.submit_order(order)
+        broker.lookup_error = ConnectionError("503")
+
+        await manager._check_order_updates()
+        assert order.retry_count == 1
+        # Still backing off: a second sweep straight away skips the order
+        await manager._check_order_updates()
+        assert order.retry_count == 1
+
+        for _ in range(2):
+            manager._retry_at.clear()
+            await manager._check_order_updates()
+        assert order.status == OrderStatus.FAILED
+        assert "Max retries exceeded" in order.last_error
+        assert not manager.get_active_orders()
+        assert list(manager.completed_orders) == [order]
+        await manager.cleanup()
+
+    asyncio.run(run())
+
+
+def test_push_update_resolves_by_client_order_id():
+    async def run():
+        broker = FlakyBroker()
+        manager = OrderManager(broker, journal_file=None)
+        order = EnhancedOrder("AAPL", "buy", 4)
+        await manager.submit_order(order)
+        await manager._on_push({"order": {"client_order_id": order.client_order_id,
+                                          "status": "partially_filled", "filled_qty": "1",
+                                          "filled_avg_price": "101"}})
+        assert order.status == OrderStatus.PARTIALLY_FILLED
+        assert manager.get_order_by_symbol("AAPL") == [order]
+        # Updates that only carry the broker id resolve through the index
+        await manager._on_push({"order": {"id": order.order_id, "status": "filled", "filled_qty": "4"}})
+        assert order.status == OrderStatus.FILLED
+        assert manager.get_order_by_symbol("AAPL") == []
+        await manager.cleanup()
+
+    asyncio.run(run())
+
+
+class StreamingBroker(FlakyBroker):
+    """Flaky broker with an order update stream that never authorizes."""
+
+    def __init__(self):
+        super().__init__()
+        self.order_stream_connected = False
+
+    async def stream_order_updates(self, callback):
+        await asyncio.Event().wait()
+
+
+def test_orders_are_polled_while_the_stream_is_down():
+    async def run():
+        broker = StreamingBroker()
+        manager = OrderManager(broker, journal_file=None)
+        manager.monitoring_interval = 0.01
+        order = EnhancedOrder("AAPL", "buy", 3)
+        await manager.submit_order(order)
+        assert manager.stream_task is not None
+        await asyncio.sleep(0.05)
+
+        # The socket is still connecting, so sweeps keep the usual cadence
+        broker.orders[order.order_id].update(status="filled", filled_qty="3")
+        await asyncio.sleep(0.05)
+        assert order.status == OrderStatus.FILLED
+        await manager.cleanup()
+
+    asyncio.run(run())
+
+
+def test_active_orders_view_is_read_only():
+    async def run():
+        manager = OrderManager(FlakyBroker(), journal_file=None)
+        view = manager.get_active_orders()
+        order = EnhancedOrder("AAPL", "buy", 1)
+        await manager.submit_order(order)
+        assert view[order.client_order_id] is order
+        try:
+            view["x"] = order
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("active order view accepted a write")
+        await manager.cleanup()
+
+    asyncio.run(run())
+
+
+def test_completed_orders_are_removed_from_journal(tmp_path):
+    async def run():
+        broker = FlakyBroker()
+        journal = OrderJournal(str(tmp_path / "orders.db"))
+        manager = OrderManager(broker, order_journal=journal)
+        order = EnhancedOrder("AAPL", "buy", 1)
+        await manager.submit_order(order)
+        assert [o["client_order_id"] for o in journal.pending_orders()] == [order.client_order_id]
+        broker.orders[order.order_id].update(status="filled", filled_qty="1")
+        await manager._check_order_updates()
+        assert journal.pending_orders() == []
+        await manager.cleanup()
+
+    asyncio.run(run())
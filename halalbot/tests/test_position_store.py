@@ -0,0 +1,34 @@
+import asyncio
+import json
+
+import numpy as np
+
+from halalbot.core.position_store import PositionStore
+
+
+def test_numpy_quantities_are_saved(tmp_path):
+    path = tmp_path / "positions.json"
+    store = PositionStore(str(path))
+    store.add_position("AAPL", "buy", np.float64(12.5), np.float32(10.0), 9.0, 12.0, "momentum")
+    store.add_position("MSFT", "buy", np.int64(3), 300.0, 290.0, 320.0, "momentum")
+    saved = json.loads(path.read_text())
+    assert saved["AAPL"]["qty"] == 12.5
+    assert saved["MSFT"]["qty"] == 3
+    assert PositionStore(str(path)).get_open_positions() == saved
+
+
+def test_debounced_saves_land_on_flush(tmp_path):
+    path = tmp_path / "positions.json"
+
+    async def run():
+        store = PositionStore(str(path), save_delay=60.0)
+        store.add_position("AAPL", "buy", 10, 100.0, 95.0, 110.0, "momentum")
+        store.add_position("MSFT", "buy", 5, 300.0, 290.0, 320.0, "momentum")
+        store.close_position("AAPL")
+        # Coalesced on the running loop: nothing written before the delay
+        assert not path.exists()
+        store.flush()
+        assert json.loads(path.read_text()) == {"MSFT": store.get_open_positions()["MSFT"]}
+        assert store.is_open("MSFT") and not store.is_open("AAPL")
+
+    asyncio.run(run())
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from halalbot.core.risk import RiskManager
@@ -10,3 +11,31 @@ def test_calculate_position_size():
     # Risk amount = 1000 * 0.02 = 20; per‑share risk = 1; so raw size = 20 shares
     # Max position pct = 0.1 * 1000 / 10 = 10 shares
     assert pytest.approx(size) == 10
+
+
+def test_calculate_position_sizes_matches_scalar():
+    rm = RiskManager(max_position_risk=0.02, max_position_pct=0.1)
+    prices = np.array([10.0, 50.0, 10.0, 0.0])
+    stops = np.array([9.0, np.nan, 10.0, 5.0])
+    sizes = rm.calculate_position_sizes(1000, prices, stops)
+    expected = [
+        rm.calculate_position_size(1000, 10.0, 9.0),
+        rm.calculate_position_size(1000, 50.0, None),
+        rm.calculate_position_size(1000, 10.0, 10.0),
+        rm.calculate_position_size(1000, 0.0, 5.0),
+    ]
+    assert sizes == pytest.approx(expected)
+
+
+def test_calculate_portfolio_risk():
+    rm = RiskManager(max_position_risk=0.01)
+    positions = {
+        "AAA": {"qty": 10, "entry_price": 30.0},
+        "BBB": {"qty": 5, "entry_price": 20.0},
+    }
+    risk = rm.calculate_portfolio_risk(positions)
+    # Values 300 and 100: weights 0.75 and 0.25
+    assert risk["portfolio_value"] == pytest.approx(400)
+    assert risk["risk_at_risk"] == pytest.approx(4)
+    assert risk["concentration_risk"] == pytest.approx(0.75 ** 2 + 0.25 ** 2)
+    assert risk["number_of_positions"] == 2
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+from halalbot.strategies.mean_reversion import MeanReversionStrategy
+from halalbot.strategies.ml import MLStrategy
+from halalbot.strategies.momentum import MomentumStrategy
+
+
+def _random_walk(n: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({"close": np.round(100 + rng.standard_normal(n).cumsum(), 2)})
+
+
+def test_momentum_signals_match_window_mean():
+    df = _random_walk()
+    lookback = 20
+    strategy = MomentumStrategy(lookback)
+    expected = []
+    for i in range(len(df)):
+        if i < lookback:
+            expected.append("hold")
+            continue
+        ma = df["close"].iloc[i - lookback : i].mean()
+        price = df["close"].iloc[i]
+        expected.append("buy" if price > ma else "sell" if price < ma else "hold")
+    assert [strategy.generate_signal(df, i) for i in range(len(df))] == expected
+    codes = {"buy": 1, "sell": -1, "hold": 0}
+    signals = strategy.generate_signals(df)
+    assert signals.dtype == np.int8
+    assert signals.tolist() == [codes[s] for s in expected]
+
+
+def test_mean_reversion_kernel_matches_window_zscores():
+    df = _random_walk()
+    df.loc[100:130, "close"] = df["close"].iloc[100]  # flat stretch: zero variance
+    lookback, entry_z, exit_z = 10, 1.0, 0.5
+    position = 0
+    expected = []
+    for i in range(len(df)):
+        sig = "hold"
+        window = df["close"].iloc[max(i - lookback, 0) : i]
+        if i >= lookback and window.std() != 0:
+            z = (df["close"].iloc[i] - window.mean()) / window.std()
+            if position == 0 and abs(z) > entry_z:
+                position = -1 if z > 0 else 1
+                sig = "sell" if z > 0 else "buy"
+            elif position != 0 and abs(z) < exit_z:
+                sig = "sell" if position > 0 else "buy"
+                position = 0
+        expected.append(sig)
+    strategy = MeanReversionStrategy(lookback, entry_z, exit_z)
+    assert [strategy.generate_signal(df, i) for i in range(len(df))] == expected
+    codes = {"buy": 1, "sell": -1, "hold": 0}
+    batch = MeanReversionStrategy(lookback, entry_z, exit_z)
+    assert batch.generate_signals(df).tolist() == [codes[s] for s in expected]
+    assert batch.position == strategy.position == position
+
+
+def test_ml_features_match_window_returns():
+    df = _random_walk(100)
+    strategy = MLStrategy(model=None, feature_window=10)
+    for i in range(10, len(df)):
+        returns = df["close"].iloc[i - 10 : i].pct_change().dropna().to_numpy()
+        features = strategy._extract_features(df, i)
+        assert features.shape == (1, 2)
+        np.testing.assert_allclose(features[0], [returns.mean(), returns.std()], atol=1e-12)
+
+
+def test_momentum_latest_bar_matches_prepared_series():
+    df = _random_walk()
+    prepared = MomentumStrategy(20)
+    expected = [prepared.generate_signal(df, i) for i in range(len(df))]
+    live = MomentumStrategy(20)
+    # A live tick sees a new frame ending at the bar being evaluated
+    for i in range(20, len(df)):
+        assert live.generate_signal(df.iloc[: i + 1], i) == expected[i]
+    assert live._close is None  # the whole series was never recomputed
+
+
+def test_mean_reversion_latest_bar_matches_prepared_series():
+    df = _random_walk()
+    prepared = MeanReversionStrategy(10)
+    expected = [prepared.generate_signal(df, i) for i in range(len(df))]
+    live = MeanReversionStrategy(10)
+    for i in range(len(df)):
+        assert live.generate_signal(df.iloc[: i + 1], i) == expected[i]
+    assert live._z is None
+    assert live.position == prepared.position
+
+
+def test_ml_latest_bar_features_match_prepared_series():
+    df = _random_walk(100)
+    prepared = MLStrategy(model=None, feature_window=10)
+    live = MLStrategy(model=None, feature_window=10)
+    for i in range(1, len(df)):
+        np.testing.assert_allclose(live._extract_features(df.iloc[: i + 1], i),
+                                   prepared._extract_features(df, i), atol=1e-12)
+    assert live._mean is None
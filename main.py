@@ -63,6 +63,18 @@ def setup_logging(level=logging.INFO, verbose=False):
 logger = logging.getLogger(__name__)
 
 
+def install_uvloop() -> bool:
+    """Use uvloop's libuv-based event loop when it is installed (Unix only)"""
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 class DualModeTradingSystem:
     """
     Main application orchestrator for the Dual-Mode Trading System
@@ -588,5 +600,6 @@ Examples:
 
 
 if __name__ == "__main__":
-    # Run the main application
+    # Run the main application, on uvloop where available
+    install_uvloop()
     asyncio.run(main())
\ No newline at end of file
@@ -60,6 +60,7 @@ class PortfolioManager:
         # Performance tracking
         self.daily_values: List[Tuple[float, float]] = []  # (timestamp, portfolio_value)
         self.last_daily_record = 0.0
+        self._history_stats_cache: Optional[Tuple[Tuple[int, float, float], Optional[Dict[str, float]]]] = None
     
     def set_dependencies(self, price_feed=None, risk_manager=None):
         """Inject dependencies"""
@@ -323,12 +324,16 @@ class PortfolioManager:
             
             self.last_daily_record = current_time
     
-    def calculate_portfolio_metrics(self) -> Dict[str, Any]:
-        """Calculate comprehensive portfolio performance metrics"""
-        if not self.price_feed or len(self.daily_values) < 2:
-            return {"error": "Insufficient data for metrics calculation"}
+    def _history_stats(self) -> Optional[Dict[str, float]]:
+        """Statistics derived from ``daily_values``, memoized per history state.
         
-        current_value = self.portfolio.get_portfolio_value(self.price_feed)
+        ``daily_values`` only changes once a day, so the result is cached under a
+        cheap fingerprint (length plus first/last timestamps) and reused by every
+        call in between; only the live portfolio value is re-read per call.
+        """
+        fingerprint = (len(self.daily_values), self.daily_values[0][0], self.daily_values[-1][0])
+        if self._history_stats_cache is not None and self._history_stats_cache[0] == fingerprint:
+            return self._history_stats_cache[1]
         
         # Calculate returns
         daily_returns = []
@@ -339,48 +344,74 @@ class PortfolioManager:
             daily_returns.append(daily_return)
         
         if not daily_returns:
-            return {"error": "No return data available"}
-        
-        # Calculate metrics
-        import statistics
-        
-        avg_daily_return = statistics.mean(daily_returns)
-        std_daily_return = statistics.stdev(daily_returns) if len(daily_returns) > 1 else 0.0
-        
-        # Annualized metrics (assuming 365 trading days)
-        annual_return = (avg_daily_return * 365) * 100
-        annual_volatility = (std_daily_return * (365 ** 0.5)) * 100
+            stats = None
+        else:
+            # Calculate metrics
+            import statistics
+            
+            avg_daily_return = statistics.fmean(daily_returns)
+            std_daily_return = statistics.stdev(daily_returns) if len(daily_returns) > 1 else 0.0
+            
+            # Annualized metrics (assuming 365 trading days)
+            annual_return = (avg_daily_return * 365) * 100
+            annual_volatility = (std_daily_return * (365 ** 0.5)) * 100
+            
+            # Sharpe ratio (assuming 0% risk-free rate)
+            sharpe_ratio = annual_return / annual_volatility if annual_volatility > 0 else 0
+            
+            # Maximum drawdown
+            peak = self.daily_values[0][1]
+            max_drawdown = 0.0
+            
+            for timestamp, value in self.daily_values:
+                if value > peak:
+                    peak = value
+                drawdown = (peak - value) / peak
+                max_drawdown = max(max_drawdown, drawdown)
+            
+            stats = {
+                'initial_value': self.daily_values[0][1],
+                'max_drawdown': max_drawdown,
+                'avg_daily_return': avg_daily_return,
+                'annual_return': annual_return,
+                'annual_volatility': annual_volatility,
+                'sharpe_ratio': sharpe_ratio,
+                'win_rate_days': sum(1 for r in daily_returns if r > 0) / len(daily_returns) * 100,
+                'best_day_return': max(daily_returns),
+                'worst_day_return': min(daily_returns)
+            }
         
-        # Sharpe ratio (assuming 0% risk-free rate)
-        sharpe_ratio = annual_return / annual_volatility if annual_volatility > 0 else 0
+        self._history_stats_cache = (fingerprint, stats)
+        return stats
+    
+    def calculate_portfolio_metrics(self) -> Dict[str, Any]:
+        """Calculate comprehensive portfolio performance metrics"""
+        if not self.price_feed or len(self.daily_values) < 2:
+            return {"error": "Insufficient data for metrics calculation"}
         
-        # Maximum drawdown
-        peak = self.daily_values[0][1]
-        max_drawdown = 0.0
+        current_value = self.portfolio.get_portfolio_value(self.price_feed)
         
-        for timestamp, value in self.daily_values:
-            if value > peak:
-                peak = value
-            drawdown = (peak - value) / peak
-            max_drawdown = max(max_drawdown, drawdown)
+        stats = self._history_stats()
+        if stats is None:
+            return {"error": "No return data available"}
         
         # Total return
-        initial_value = self.daily_values[0][1]
+        initial_value = stats['initial_value']
         total_return = ((current_value - initial_value) / initial_value) * 100
         
         return {
             'current_value': current_value,
             'initial_value': initial_value,
             'total_return_percent': total_return,
-            'annual_return_percent': annual_return,
-            'annual_volatility_percent': annual_volatility,
-            'sharpe_ratio': sharpe_ratio,
-            'max_drawdown_percent': max_drawdown * 100,
+            'annual_return_percent': stats['annual_return'],
+            'annual_volatility_percent': stats['annual_volatility'],
+            'sharpe_ratio': stats['sharpe_ratio'],
+            'max_drawdown_percent': stats['max_drawdown'] * 100,
             'days_tracked': len(self.daily_values),
-            'avg_daily_return_percent': avg_daily_return * 100,
-            'win_rate_days': sum(1 for r in daily_returns if r > 0) / len(daily_returns) * 100,
-            'best_day_return': max(daily_returns) * 100,
-            'worst_day_return': min(daily_returns) * 100
+            'avg_daily_return_percent': stats['avg_daily_return'] * 100,
+            'win_rate_days': stats['win_rate_days'],
+            'best_day_return': stats['best_day_return'] * 100,
+            'worst_day_return': stats['worst_day_return'] * 100
         }
     
     def get_portfolio_summary(self) -> Dict[str, Any]:
@@ -0,0 +1,31 @@
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "trading-platform", "backend"))
+
+import database  # noqa: E402
+
+
+def test_prune_history_drops_only_old_points(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "db", database.Database(str(tmp_path / "test.db")))
+    now = datetime.now()
+
+    async def run():
+        await database.init_db()
+        for age_days in (200, 120, 91, 10, 0):
+            await database.PortfolioRepository.add_history_point({
+                "timestamp": (now - timedelta(days=age_days)).isoformat(),
+                "total_value": 1000.0,
+                "pnl": 0.0,
+                "pnl_percent": 0.0,
+                "active_bots": 1,
+            })
+        # A small batch size forces several delete batches
+        deleted = await database.PortfolioRepository.prune_history(days=90, batch_size=2)
+        return deleted, await database.PortfolioRepository.get_history()
+
+    deleted, remaining = asyncio.run(run())
+    assert deleted == 3
+    assert len(remaining) == 2
@@ -74,12 +74,12 @@ class BotInstance:
         logger.info(f"Stopped bot {self.id}")
         return True
     
-    def get_runtime(self) -> str:
+    def get_runtime(self, now: Optional[datetime] = None) -> str:
         """Get formatted runtime"""
         if not self.start_time or self.status == "stopped":
             return "00:00:00"
         
-        runtime = datetime.now() - self.start_time
+        runtime = (now or datetime.now()) - self.start_time
         hours, remainder = divmod(int(runtime.total_seconds()), 3600)
         minutes, seconds = divmod(remainder, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
@@ -178,6 +178,7 @@ class BotManager:
         """Get all bots"""
         bot_data_list = await BotRepository.get_all_bots()
         result = []
+        now = datetime.now()  # one clock read for the whole listing
         
         for bot_data in bot_data_list:
             bot_id = bot_data["id"]
@@ -187,7 +188,7 @@ class BotManager:
                 bot_instance = BotInstance(bot_id, bot_data)
                 self.bots[bot_id] = bot_instance
             
-            result.append(self._format_bot_response(self.bots[bot_id], bot_data))
+            result.append(self._format_bot_response(self.bots[bot_id], bot_data, now))
         
         return result
     
@@ -227,9 +228,10 @@ class BotManager:
         """Get overall portfolio statistics"""
         all_bots = await self.get_all_bots()
         
+        today = datetime.now().date()
         active_bots = len([bot for bot in all_bots if bot["status"] == "running"])
         new_bots = len([bot for bot in all_bots if 
-                       datetime.fromisoformat(bot["createdAt"]).date() == datetime.now().date()])
+                       datetime.fromisoformat(bot["createdAt"]).date() == today])
         
         total_pnl = sum(bot["dailyPnl"] for bot in all_bots)
         total_value = 125000 + total_pnl  # Base portfolio value
@@ -286,7 +288,8 @@ class BotManager:
         self.bots.clear()
         logger.info("All bots shut down")
     
-    def _format_bot_response(self, bot_instance: BotInstance, bot_data: Dict) -> Dict[str, Any]:
+    def _format_bot_response(self, bot_instance: BotInstance, bot_data: Dict,
+                             now: Optional[datetime] = None) -> Dict[str, Any]:
         """Format bot data for API response"""
         return {
             "id": bot_data["id"],
@@ -296,7 +299,7 @@ class BotManager:
             "market": bot_data["market"],
             "mode": "Paper" if bot_data["paper_trading"] else "Live",
             "isConnected": bot_data["connect_api"],
-            "runtime": bot_instance.get_runtime(),
+            "runtime": bot_instance.get_runtime(now),
             "dailyPnl": round(bot_instance.daily_pnl + (random.random() * 100 - 50), 2),
             "status": bot_instance.status,
             "createdAt": bot_data["created_at"].split("T")[0]
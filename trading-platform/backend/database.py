@@ -6,7 +6,7 @@ import os
 import sqlite3
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -41,6 +41,14 @@ class Database:
             cursor.execute(query, params)
             conn.commit()
             return cursor.fetchone()
+    
+    async def execute_write(self, query: str, params: tuple = ()) -> int:
+        """Execute a write statement and return the number of affected rows"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            conn.commit()
+            return cursor.rowcount
 
 
 # Global database instance
@@ -85,6 +93,11 @@ async def init_db():
         )
     """)
     
+    await db.execute_query("""
+        CREATE INDEX IF NOT EXISTS idx_portfolio_history_timestamp
+        ON portfolio_history (timestamp)
+    """)
+    
     # Trades table
     await db.execute_query("""
         CREATE TABLE IF NOT EXISTS trades (
@@ -215,6 +228,28 @@ class PortfolioRepository:
         """, (days * 24,))  # Assuming hourly data points
         
         return [dict(row) for row in results]
+    
+    @staticmethod
+    async def prune_history(days: int = 90, batch_size: int = 10000) -> int:
+        """Delete history points older than ``days`` in bounded batches.
+        
+        Each batch is its own short transaction so a large backlog never holds
+        the write lock (or grows the journal) for the whole cleanup.
+        """
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        deleted = 0
+        while True:
+            count = await db.execute_write("""
+                DELETE FROM portfolio_history WHERE id IN (
+                    SELECT id FROM portfolio_history
+                    WHERE timestamp < ? LIMIT ?
+                )
+            """, (cutoff, batch_size))
+            deleted += count
+            if count < batch_size:
+                break
+        
+        return deleted
 
 
 class TradeRepository:
@@ -19,7 +19,7 @@ import uvicorn
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from bot_manager import BotManager
-from database import init_db, get_db
+from database import init_db, get_db, PortfolioRepository
 from websocket_manager import WebSocketManager
 from models import *
 
@@ -38,6 +38,8 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Solsak Trading Platform Backend...")
     await init_db()
     logger.info("Database initialized")
+    pruned = await PortfolioRepository.prune_history()
+    logger.info(f"Pruned {pruned} portfolio history points")
     
     yield
     